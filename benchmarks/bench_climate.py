@@ -0,0 +1,106 @@
+"""Benchmark GenericClimate against replayed temperature traces.
+
+Usage:
+    python benchmarks/bench_climate.py [--zones 1 100 1000] [--trace FILE]
+        [--hours 6] [--json OUT] [--baseline FILE] [--max-regression 0.25]
+
+Without `--trace` a synthetic trace is used. With `--baseline` the run fails
+when events/sec drops, or service calls per zone-hour grow, by more than
+`--max-regression` compared to a previous `--json` output.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import timedelta
+import json
+import sys
+
+from harness import Simulation, load_trace, synthetic_trace
+
+COLUMNS = (
+    "zones",
+    "events",
+    "events_per_second",
+    "latency_p50_ms",
+    "latency_p95_ms",
+    "latency_p99_ms",
+    "lock_wait_ms",
+    "service_calls_per_zone_hour",
+    "state_writes",
+)
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--zones", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--trace", help="CSV or JSON temperature trace")
+    parser.add_argument(
+        "--hours", type=float, default=6.0, help="length of the synthetic trace"
+    )
+    parser.add_argument(
+        "--keep-alive", type=float, help="keep_alive interval in seconds"
+    )
+    parser.add_argument(
+        "--min-cycle", type=float, help="min_cycle_duration in seconds"
+    )
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="compare against a previous --json file")
+    parser.add_argument("--max-regression", type=float, default=0.25)
+    return parser.parse_args(argv)
+
+
+def _regressions(results, baseline, max_regression):
+    previous = {row["zones"]: row for row in baseline}
+    failures = []
+    for row in results:
+        if (old := previous.get(row["zones"])) is None:
+            continue
+        if row["events_per_second"] < old["events_per_second"] * (1 - max_regression):
+            failures.append(
+                f"{row['zones']} zones: events/sec {row['events_per_second']}"
+                f" < baseline {old['events_per_second']}"
+            )
+        if row["service_calls_per_zone_hour"] > old["service_calls_per_zone_hour"] * (
+            1 + max_regression
+        ):
+            failures.append(
+                f"{row['zones']} zones: service calls/zone-hour"
+                f" {row['service_calls_per_zone_hour']}"
+                f" > baseline {old['service_calls_per_zone_hour']}"
+            )
+    return failures
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    trace = load_trace(args.trace) if args.trace else synthetic_trace(args.hours)
+    options = {}
+    if args.keep_alive:
+        options["keep_alive"] = timedelta(seconds=args.keep_alive)
+    if args.min_cycle:
+        options["min_cycle_duration"] = timedelta(seconds=args.min_cycle)
+
+    results = []
+    print(" ".join(f"{column:>14}" for column in COLUMNS))
+    for zones in args.zones:
+        row = Simulation(zones, trace, **options).run().as_dict()
+        results.append(row)
+        print(" ".join(f"{row[column]:>14}" for column in COLUMNS), flush=True)
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            failures = _regressions(results, json.load(file), args.max_regression)
+        for failure in failures:
+            print(f"REGRESSION: {failure}", file=sys.stderr)
+        if failures:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""Benchmark how long loading the Generic Climate modules takes.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat 5] [--json OUT]
+        [--baseline FILE] [--max-regression 0.25]
+
+Every target is imported in a fresh interpreter that has already loaded
+what a running Home Assistant always has, and the fastest of `--repeat`
+runs is kept. The run fails when the integration, its config flow or its
+sensors import the climate platform or the helpers it needs. With
+`--baseline` it also fails when a target loads slower, by more than
+`--max-regression`, than in a previous `--json` output.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+PACKAGE = "custom_components.generic_climate"
+
+# Loaded by Home Assistant before any integration.
+PRELOAD = (
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+)
+PLATFORM = (
+    f"{PACKAGE}.climate",
+    f"{PACKAGE}.coordinator",
+    "homeassistant.components.climate",
+    "homeassistant.helpers.condition",
+    "homeassistant.helpers.reload",
+    "homeassistant.helpers.restore_state",
+)
+# Target -> (module, modules it must not pull in).
+TARGETS = {
+    "integration": (PACKAGE, PLATFORM),
+    "config_flow": (f"{PACKAGE}.config_flow", PLATFORM),
+    "sensor": (f"{PACKAGE}.sensor", PLATFORM[:3]),
+    "climate": (f"{PACKAGE}.climate", ()),
+}
+
+CHILD = """
+import importlib, json, sys, time
+sys.path.insert(0, {root!r})
+for name in {preload!r}:
+    importlib.import_module(name)
+before = set(sys.modules)
+start = time.perf_counter()
+importlib.import_module({module!r})
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "modules": sorted(set(sys.modules) - before)}}))
+"""
+
+COLUMNS = ("target", "import_ms", "modules")
+
+
+def measure(module: str, repeat: int) -> tuple[float, list[str]]:
+    """Return the fastest import time in ms and the modules it loaded."""
+    code = CHILD.format(root=ROOT, preload=PRELOAD, module=module)
+    best = None
+    modules: list[str] = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        ).stdout
+        result = json.loads(output)
+        if best is None or result["seconds"] < best:
+            best = result["seconds"]
+        modules = result["modules"]
+    return round(best * 1000, 2), modules
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="compare against a previous --json file")
+    parser.add_argument("--max-regression", type=float, default=0.25)
+    return parser.parse_args(argv)
+
+
+def _regressions(results, baseline, max_regression):
+    previous = {row["target"]: row for row in baseline}
+    failures = []
+    for row in results:
+        if (old := previous.get(row["target"])) is None:
+            continue
+        if row["import_ms"] > old["import_ms"] * (1 + max_regression):
+            failures.append(
+                f"{row['target']}: import {row['import_ms']} ms"
+                f" > baseline {old['import_ms']} ms"
+            )
+    return failures
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    results = []
+    failures = []
+    print(" ".join(f"{column:>14}" for column in COLUMNS))
+    for target, (module, forbidden) in TARGETS.items():
+        import_ms, modules = measure(module, args.repeat)
+        row = {"target": target, "import_ms": import_ms, "modules": len(modules)}
+        results.append(row)
+        print(" ".join(f"{row[column]:>14}" for column in COLUMNS), flush=True)
+        failures.extend(
+            f"{target}: imports {name}" for name in forbidden if name in modules
+        )
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            failures.extend(
+                _regressions(results, json.load(file), args.max_regression)
+            )
+    for failure in failures:
+        print(f"REGRESSION: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,412 @@
+"""Headless stand-in for the Home Assistant core used to drive GenericClimate.
+
+The harness provides just enough of `hass` for the climate platform: a state
+machine, a `homeassistant.turn_on/turn_off` service registry, a state change
+event bus and an event loop running on a virtual clock. Real `GenericClimate`
+entities are created against it and fed from temperature traces, so a day of
+sensor data replays in seconds.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import inspect
+import json
+import math
+from pathlib import Path
+import sys
+from time import perf_counter
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.const import (  # noqa: E402
+    ATTR_ENTITY_ID,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.core import CoreState, HassJob, State  # noqa: E402
+from homeassistant.util import dt as dt_util  # noqa: E402
+from homeassistant.util.unit_system import METRIC_SYSTEM  # noqa: E402
+
+from custom_components.generic_climate import (  # noqa: E402
+    async_get_coordinator,
+    climate,
+)
+
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class VirtualClockLoop(asyncio.SelectorEventLoop):
+    """Event loop whose clock only moves when the simulation advances it."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._now = 0.0
+
+    def time(self) -> float:
+        return self._now
+
+    def utcnow(self) -> datetime:
+        """Return the virtual wall clock."""
+        return EPOCH + timedelta(seconds=self._now)
+
+    def _next_timer(self) -> float | None:
+        # The loop's private timer heap is the only way to find the next
+        # deadline without waiting for it in real time.
+        return min(
+            (timer.when() for timer in self._scheduled if not timer.cancelled()),
+            default=None,
+        )
+
+    async def settle(self) -> None:
+        """Yield until no callback is ready and no timer is due."""
+        while True:
+            await asyncio.sleep(0)
+            if self._ready:
+                continue
+            next_timer = self._next_timer()
+            if next_timer is None or next_timer > self._now:
+                return
+
+    async def advance_to(self, when: float) -> None:
+        """Move virtual time to `when`, firing every timer that falls due."""
+        while True:
+            await self.settle()
+            next_timer = self._next_timer()
+            if next_timer is None or next_timer > when:
+                break
+            self._now = max(self._now, next_timer)
+        self._now = max(self._now, when)
+        await self.settle()
+
+
+class TimedLock(asyncio.Lock):
+    """asyncio.Lock that accumulates the time spent waiting to acquire it."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.wait = 0.0
+
+    async def acquire(self) -> bool:
+        start = perf_counter()
+        result = await super().acquire()
+        self.wait += perf_counter() - start
+        return result
+
+
+class StateMachine:
+    """Minimal state machine firing state change events on the bus."""
+
+    def __init__(self, bus: EventBus) -> None:
+        self._states: dict[str, State] = {}
+        self._bus = bus
+
+    def get(self, entity_id: str) -> State | None:
+        return self._states.get(entity_id)
+
+    def is_state(self, entity_id: str, state: str) -> bool:
+        current = self._states.get(entity_id)
+        return current is not None and current.state == state
+
+    def async_set(self, entity_id: str, new_state: str, attributes=None) -> None:
+        old = self._states.get(entity_id)
+        if old is not None and old.state == new_state and attributes is None:
+            return
+        state = State(entity_id, new_state, attributes or {})
+        if old is not None and old.state == new_state:
+            state.last_changed = old.last_changed
+        self._states[entity_id] = state
+        self._bus.async_fire_state_changed(entity_id, old, state)
+
+
+class EventBus:
+    """Route state change events to per-entity listeners."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._listeners: dict[str, list] = {}
+
+    def async_listen_once(self, event_type, listener):
+        return lambda: None
+
+    def async_track(self, entity_ids, action):
+        job = HassJob(action)
+        for entity_id in entity_ids:
+            self._listeners.setdefault(entity_id, []).append(job)
+
+        def _remove():
+            for entity_id in entity_ids:
+                self._listeners[entity_id].remove(job)
+
+        return _remove
+
+    def async_fire_state_changed(self, entity_id, old_state, new_state) -> None:
+        event = SimpleNamespace(
+            data={
+                "entity_id": entity_id,
+                "old_state": old_state,
+                "new_state": new_state,
+            }
+        )
+        for job in list(self._listeners.get(entity_id, ())):
+            result = job.target(event)
+            if asyncio.iscoroutine(result):
+                self._loop.create_task(result)
+
+
+class ServiceRegistry:
+    """`homeassistant.turn_on/turn_off` acting directly on the state machine."""
+
+    def __init__(self, states: StateMachine) -> None:
+        self._states = states
+        self.calls = 0
+
+    async def async_call(self, domain, service, data, context=None, **kwargs):
+        assert service in (SERVICE_TURN_ON, SERVICE_TURN_OFF)
+        self.calls += 1
+        entity_ids = data[ATTR_ENTITY_ID]
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        new_state = STATE_ON if service == SERVICE_TURN_ON else STATE_OFF
+        for entity_id in entity_ids:
+            self._states.async_set(entity_id, new_state)
+
+
+class SimHass:
+    """The parts of `HomeAssistant` used by the climate platform."""
+
+    def __init__(self, loop: VirtualClockLoop) -> None:
+        self.loop = loop
+        self.bus = EventBus(loop)
+        self.states = StateMachine(self.bus)
+        self.services = ServiceRegistry(self.states)
+        self.data: dict = {}
+        self.state = CoreState.running
+        self.config = SimpleNamespace(units=METRIC_SYSTEM)
+
+    def async_create_task(self, target, *args, **kwargs):
+        return self.loop.create_task(target)
+
+    def async_run_hass_job(self, job, *args, **kwargs):
+        result = job.target(*args)
+        if asyncio.iscoroutine(result):
+            return self.loop.create_task(result)
+        return None
+
+
+def _patch_helpers(hass: SimHass) -> None:
+    """Point the platform's event helpers at the simulated core."""
+
+    def track_state_change_event(_hass, entity_ids, action):
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        return hass.bus.async_track(list(entity_ids), action)
+
+    def call_later(_hass, delay, action):
+        if isinstance(delay, timedelta):
+            delay = delay.total_seconds()
+        job = HassJob(action)
+        handle = hass.loop.call_later(
+            delay, lambda: hass.async_run_hass_job(job, hass.loop.utcnow())
+        )
+        return handle.cancel
+
+    climate.async_track_state_change_event = track_state_change_event
+    climate.async_call_later = call_later
+    dt_util.utcnow = hass.loop.utcnow
+
+
+def load_trace(path: str | Path) -> list[tuple[float, float]]:
+    """Load a `(seconds, temperature)` trace from a CSV or JSON file.
+
+    CSV files need `time` and `temperature` columns. JSON files hold either a
+    list of `[time, temperature]` pairs or of objects with those keys.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        rows = json.loads(path.read_text())
+        trace = [
+            (float(row["time"]), float(row["temperature"]))
+            if isinstance(row, dict)
+            else (float(row[0]), float(row[1]))
+            for row in rows
+        ]
+    else:
+        with path.open(newline="") as file:
+            trace = [
+                (float(row["time"]), float(row["temperature"]))
+                for row in csv.DictReader(file)
+            ]
+    trace.sort()
+    return trace
+
+
+def synthetic_trace(hours: float, step: float = 60.0) -> list[tuple[float, float]]:
+    """Return a daily sine around 21 degrees with a faster ripple on top."""
+    return [
+        (
+            t,
+            21.0
+            + 1.5 * math.sin(2 * math.pi * t / 86400)
+            + 0.6 * math.sin(2 * math.pi * t / 1800),
+        )
+        for t in (i * step for i in range(int(hours * 3600 / step) + 1))
+    ]
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+@dataclass
+class SimulationResult:
+    """Metrics of one simulation run."""
+
+    zones: int
+    events: int
+    simulated_hours: float
+    wall_time: float
+    latencies: list[float] = field(repr=False)
+    lock_wait: float
+    service_calls: int
+    state_writes: int
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.wall_time if self.wall_time else 0.0
+
+    @property
+    def service_calls_per_zone_hour(self) -> float:
+        zone_hours = self.zones * self.simulated_hours
+        return self.service_calls / zone_hours if zone_hours else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "zones": self.zones,
+            "events": self.events,
+            "events_per_second": round(self.events_per_second, 1),
+            "latency_p50_ms": round(_percentile(self.latencies, 0.50) * 1000, 4),
+            "latency_p95_ms": round(_percentile(self.latencies, 0.95) * 1000, 4),
+            "latency_p99_ms": round(_percentile(self.latencies, 0.99) * 1000, 4),
+            "lock_wait_ms": round(self.lock_wait * 1000, 3),
+            "service_calls_per_zone_hour": round(
+                self.service_calls_per_zone_hour, 3
+            ),
+            "state_writes": self.state_writes,
+        }
+
+
+class Simulation:
+    """Drive `zones` GenericClimate entities from one temperature trace."""
+
+    def __init__(self, zones: int, trace: list[tuple[float, float]], **options):
+        self.zones = zones
+        self.trace = trace
+        self.options = {"target_temp": 21.0, "initial_hvac_mode": "heat", **options}
+        self.loop = VirtualClockLoop()
+        self.hass = SimHass(self.loop)
+        self.entities: list[climate.GenericClimate] = []
+        self.latencies: list[float] = []
+        self.state_writes = 0
+
+    def run(self) -> SimulationResult:
+        """Run the simulation to the end of the trace and return its metrics."""
+        asyncio.set_event_loop(self.loop)
+        try:
+            return self.loop.run_until_complete(self._async_run())
+        finally:
+            asyncio.set_event_loop(None)
+            self.loop.close()
+
+    def _write_state(self, entity) -> None:
+        entity.state  # noqa: B018 - evaluated for its cost
+        entity.state_attributes  # noqa: B018
+        self.state_writes += 1
+
+    def _timed(self, action):
+        latencies = self.latencies
+
+        async def _async_timed(event):
+            start = perf_counter()
+            await action(event)
+            latencies.append(perf_counter() - start)
+
+        return _async_timed
+
+    async def _async_add_zone(self, index: int) -> None:
+        hass = self.hass
+        heater = f"switch.heater_{index}"
+        sensor = f"sensor.temperature_{index}"
+        hass.states.async_set(heater, STATE_OFF)
+        hass.states.async_set(sensor, str(self.trace[0][1]))
+
+        kwargs = {
+            name: None
+            for name in inspect.signature(climate.GenericClimate).parameters
+        }
+        kwargs.update(
+            name=f"Zone {index}",
+            unique_id=f"zone_{index}",
+            heater_entity_id=heater,
+            sensor_entity_id=sensor,
+            cold_tolerance=climate.DEFAULT_TOLERANCE,
+            hot_tolerance=climate.DEFAULT_TOLERANCE,
+            unit=METRIC_SYSTEM.temperature_unit,
+            coordinator=async_get_coordinator(hass),
+        )
+        kwargs.update(self.options)
+        entity = climate.GenericClimate(**kwargs)
+        entity.hass = hass
+        entity.entity_id = f"climate.zone_{index}"
+        entity.async_write_ha_state = lambda: self._write_state(entity)
+        entity._async_sensor_changed = self._timed(entity._async_sensor_changed)
+        entity._temp_lock = TimedLock()
+        await entity.async_added_to_hass()
+        self.entities.append(entity)
+
+    async def _async_run(self) -> SimulationResult:
+        _patch_helpers(self.hass)
+        # Zones start without saved state.
+        async_get_coordinator(self.hass).async_restored = lambda entity_id: None
+        for index in range(self.zones):
+            await self._async_add_zone(index)
+        await self.loop.settle()
+        calls_before = self.hass.services.calls
+
+        # Spread zones over one sample step so they do not report in lockstep.
+        step = self.trace[1][0] - self.trace[0][0] if len(self.trace) > 1 else 1.0
+        events = sorted(
+            (t + step * index / self.zones, index, value)
+            for t, value in self.trace[1:]
+            for index in range(self.zones)
+        )
+        start_time = self.loop.time()
+        wall_start = perf_counter()
+        for when, index, value in events:
+            if start_time + when > self.loop.time():
+                await self.loop.advance_to(start_time + when)
+            self.hass.states.async_set(
+                f"sensor.temperature_{index}", f"{value + 0.05 * (index % 7):.2f}"
+            )
+        await self.loop.settle()
+        wall_time = perf_counter() - wall_start
+
+        return SimulationResult(
+            zones=self.zones,
+            events=len(events),
+            simulated_hours=(self.trace[-1][0] - self.trace[0][0]) / 3600,
+            wall_time=wall_time,
+            latencies=self.latencies,
+            lock_wait=sum(entity._temp_lock.wait for entity in self.entities),
+            service_calls=self.hass.services.calls - calls_before,
+            state_writes=self.state_writes,
+        )
@@ -0,0 +1,287 @@
+"""Tune GenericClimate tolerances from recorded history.
+
+Usage:
+    python benchmarks/tune_climate.py HISTORY [--zone SENSOR:SWITCH ...]
+        [--target 21] [--band 0.5] [--mode heat]
+        [--cold-tolerance 0.1 0.3 0.5] [--hot-tolerance 0 0.3 0.5]
+        [--weights 1 5 10] [--top 5]
+        [--workers N] [--json OUT]
+
+HISTORY is a history export holding the zone's temperature sensor and
+heater (or cooler) switch: a CSV with `entity_id`, `state` and
+`last_changed` columns as downloaded from the history panel, or the JSON
+returned by `/api/history/period`. How fast the room warms or cools with the
+switch on and off is learned from it; every combination of the swept
+parameters is then replayed against the recorded temperatures, with the
+recorded switch's effect swapped for the simulated one, and decided by the
+same rule live zones use. Settings are ranked by a weighted score of time
+outside `target +/- band` (in percent), switch starts per hour and the mean
+overshoot past the target after each cycle (in degrees).
+
+`min_cycle_duration` is not tuned: live zones decide on every sensor update
+regardless of it, and so does the replay.
+"""
+
+from __future__ import annotations
+
+import argparse
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import csv
+from datetime import datetime
+from itertools import product
+import json
+import os
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.const import STATE_ON  # noqa: E402
+
+from custom_components.generic_climate.coordinator import (  # noqa: E402
+    DECISION_TURN_OFF,
+    DECISION_TURN_ON,
+    decide,
+)
+from custom_components.generic_climate.thermal_model import (  # noqa: E402
+    ACTUATOR_COOL,
+    ACTUATOR_HEAT,
+    ACTUATOR_OFF,
+    MIN_SAMPLES,
+    ThermalModel,
+)
+
+# Learn the average rates over the whole export rather than the latest ones.
+FIT_TIME_CONSTANT = 7 * 86400.0
+
+COLUMNS = (
+    "cold_tolerance",
+    "hot_tolerance",
+    "cycles_per_hour",
+    "outside_band_pct",
+    "overshoot",
+    "score",
+)
+
+
+def _timestamp(value: str) -> float:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def load_history(path: str | Path) -> dict[str, list[tuple[float, str]]]:
+    """Load a history export into `(timestamp, state)` lists per entity."""
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        data = json.loads(path.read_text())
+        rows = [
+            row
+            for item in data
+            for row in (item if isinstance(item, list) else [item])
+        ]
+    else:
+        with path.open(newline="") as file:
+            rows = list(csv.DictReader(file))
+
+    history: dict[str, list[tuple[float, str]]] = {}
+    for row in rows:
+        changed = row.get("last_changed") or row.get("last_updated")
+        history.setdefault(row["entity_id"], []).append(
+            (_timestamp(changed), row["state"])
+        )
+    for states in history.values():
+        states.sort()
+    return history
+
+
+def prepare_zone(history, sensor: str, switch: str, cooling: bool):
+    """Return the zone's readings, the switch state for each and learned rates.
+
+    Raises ValueError when the history cannot support a replay.
+    """
+    on_label = ACTUATOR_COOL if cooling else ACTUATOR_HEAT
+    switch_states = history.get(switch, [])
+    model = ThermalModel(time_constant=FIT_TIME_CONSTANT)
+    times, temps, observed = array("d"), array("d"), array("b")
+    index, is_on = 0, False
+    for timestamp, state in history.get(sensor, []):
+        try:
+            temp = float(state)
+        except ValueError:
+            continue
+        while index < len(switch_states) and switch_states[index][0] <= timestamp:
+            is_on = switch_states[index][1] == STATE_ON
+            index += 1
+        model.add_sample(timestamp, temp, on_label if is_on else ACTUATOR_OFF)
+        times.append(timestamp)
+        temps.append(temp)
+        observed.append(is_on)
+
+    if len(times) < 2:
+        raise ValueError(f"no numeric readings of {sensor}")
+    for label in (on_label, ACTUATOR_OFF):
+        if model.samples.get(label, 0) < MIN_SAMPLES:
+            raise ValueError(f"not enough readings with {switch} {label}")
+    return (times, temps, observed), {
+        label: model.rates[label] for label in (on_label, ACTUATOR_OFF)
+    }
+
+
+def replay(series, rates, target, band, cooling, cold, hot) -> dict:
+    """Replay one zone's history with one parameter setting."""
+    times, temps, observed = series
+    on_label = ACTUATOR_COOL if cooling else ACTUATOR_HEAT
+    # Temperature change per second the switch adds over the room drifting.
+    effect = rates[on_label] - rates[ACTUATOR_OFF]
+    sign = -1.0 if cooling else 1.0
+
+    temp = temps[0]
+    active = bool(observed[0])
+    starts = 0
+    outside = 0.0
+    excesses = []
+    peak = None
+    for i in range(1, len(times)):
+        elapsed = times[i] - times[i - 1]
+        temp += temps[i] - temps[i - 1] + (active - observed[i - 1]) * effect * elapsed
+        if abs(temp - target) > band:
+            outside += elapsed
+        if peak is not None:
+            peak = max(peak, sign * (temp - target))
+
+        # Decide on every reading: sensor updates run forced control passes,
+        # which skip min_cycle_duration.
+        decision = decide(temp, target, cold, hot, cooling, active)
+        if decision == DECISION_TURN_ON:
+            active = True
+            starts += 1
+            if peak is not None:
+                excesses.append(max(peak, 0.0))
+                peak = None
+        elif decision == DECISION_TURN_OFF:
+            active = False
+            peak = sign * (temp - target)
+
+    duration = times[-1] - times[0]
+    return {
+        "cold_tolerance": cold,
+        "hot_tolerance": hot,
+        "cycles_per_hour": round(starts / (duration / 3600), 3) if duration else 0.0,
+        "outside_band_pct": round(outside / duration * 100, 2) if duration else 0.0,
+        "overshoot": round(sum(excesses) / len(excesses), 3) if excesses else 0.0,
+    }
+
+
+def _run_task(task) -> tuple[str, list[dict]]:
+    zone, series, rates, target, band, cooling, settings = task
+    return zone, [
+        replay(series, rates, target, band, cooling, *setting) for setting in settings
+    ]
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("history", help="CSV or JSON history export")
+    parser.add_argument(
+        "--zone",
+        action="append",
+        metavar="SENSOR:SWITCH",
+        help="zone to tune; repeat for more (default: the only sensor and switch)",
+    )
+    parser.add_argument("--target", type=float, default=21.0)
+    parser.add_argument(
+        "--band", type=float, default=0.5, help="comfort band around the target"
+    )
+    parser.add_argument("--mode", choices=("heat", "cool"), default="heat")
+    parser.add_argument(
+        "--cold-tolerance", type=float, nargs="+", default=[0.1, 0.2, 0.3, 0.5]
+    )
+    parser.add_argument(
+        "--hot-tolerance", type=float, nargs="+", default=[0.0, 0.1, 0.2, 0.3, 0.5]
+    )
+    parser.add_argument(
+        "--weights",
+        type=float,
+        nargs=3,
+        default=[1.0, 5.0, 10.0],
+        metavar=("BAND", "CYCLES", "OVERSHOOT"),
+        help="score weights per percent outside the band, start per hour and degree of overshoot",
+    )
+    parser.add_argument("--top", type=int, default=5, help="settings to show per zone")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--json", help="write every ranked setting to this file")
+    return parser.parse_args(argv)
+
+
+def _zones(args, history) -> list[tuple[str, str]]:
+    if args.zone:
+        return [tuple(zone.split(":", 1)) for zone in args.zone]
+    sensors = [entity_id for entity_id in history if entity_id.startswith("sensor.")]
+    switches = [
+        entity_id
+        for entity_id in history
+        if entity_id.split(".", 1)[0] in ("switch", "input_boolean")
+    ]
+    if len(sensors) != 1 or len(switches) != 1:
+        raise SystemExit("the history holds several zones; pick them with --zone")
+    return [(sensors[0], switches[0])]
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    history = load_history(args.history)
+    cooling = args.mode == "cool"
+    grid = list(product(args.cold_tolerance, args.hot_tolerance))
+
+    prepared = {}
+    for sensor, switch in _zones(args, history):
+        try:
+            prepared[sensor] = prepare_zone(history, sensor, switch, cooling)
+        except ValueError as err:
+            print(f"{sensor}: skipped, {err}", file=sys.stderr)
+    if not prepared:
+        return 1
+
+    # Split each zone's grid so every core has work even with few zones.
+    workers = max(1, args.workers or 1)
+    chunks = max(1, min(len(grid), -(-workers // len(prepared))))
+    tasks = [
+        (zone, series, rates, args.target, args.band, cooling, grid[chunk::chunks])
+        for zone, (series, rates) in prepared.items()
+        for chunk in range(chunks)
+    ]
+    results: dict[str, list[dict]] = {zone: [] for zone in prepared}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for zone, rows in executor.map(_run_task, tasks):
+            results[zone].extend(rows)
+
+    band_weight, cycles_weight, overshoot_weight = args.weights
+    report = {}
+    for zone, rows in results.items():
+        for row in rows:
+            row["score"] = round(
+                band_weight * row["outside_band_pct"]
+                + cycles_weight * row["cycles_per_hour"]
+                + overshoot_weight * row["overshoot"],
+                3,
+            )
+        rows.sort(key=lambda row: row["score"])
+        rates = prepared[zone][1]
+        report[zone] = {
+            "rates_per_hour": {label: rate * 3600 for label, rate in rates.items()},
+            "settings": rows,
+        }
+
+        print(f"\n{zone}")
+        print(" ".join(f"{column:>16}" for column in COLUMNS))
+        for row in rows[: args.top]:
+            print(" ".join(f"{row[column]:>16}" for column in COLUMNS))
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(report, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
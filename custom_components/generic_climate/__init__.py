@@ -2,19 +2,48 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+	from .coordinator import GenericClimateCoordinator
+
+PLATFORMS = ["climate", "sensor"]
+
 
-DOMAIN = "generic_climate"
-PLATFORMS = ["climate"]
+@callback
+def async_get_coordinator(hass: HomeAssistant) -> GenericClimateCoordinator:
+	"""Return the shared control coordinator, creating it on first use."""
+	if (coordinator := hass.data.get(DOMAIN)) is None:
+		# Imported on first use so the config flow never loads it.
+		from .coordinator import GenericClimateCoordinator
+
+		coordinator = hass.data[DOMAIN] = GenericClimateCoordinator(hass)
+	return coordinator
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 	"""Set up Generic Climate from a config entry."""
+	async_get_coordinator(hass)
 	await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+	entry.async_on_unload(entry.add_update_listener(async_update_options))
 	return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+	"""Apply changed options in place, reloading the entry only when needed."""
+	from .climate import async_update_entry_options
+
+	if not await async_update_entry_options(hass, entry):
+		await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 	"""Unload a config entry."""
-	return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+	if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+		async_get_coordinator(hass).entities.pop(entry.entry_id, None)
+	return unload_ok
@@ -0,0 +1,98 @@
+"""Combine readings from several temperature sensors into one value."""
+
+from __future__ import annotations
+
+from array import array
+from statistics import median
+
+AGGREGATE_MEAN = "mean"
+AGGREGATE_MEDIAN = "median"
+AGGREGATE_MIN = "min"
+AGGREGATE_MAX = "max"
+AGGREGATES = [AGGREGATE_MEAN, AGGREGATE_MEDIAN, AGGREGATE_MIN, AGGREGATE_MAX]
+
+_COMBINE = {
+    AGGREGATE_MEAN: lambda values: sum(values) / len(values),
+    AGGREGATE_MEDIAN: median,
+    AGGREGATE_MIN: min,
+    AGGREGATE_MAX: max,
+}
+
+
+class RollingWindow:
+    """Fixed-size ring buffer of readings with an O(1) running mean."""
+
+    __slots__ = ("_values", "_index", "_count", "_total", "updated")
+
+    def __init__(self, size: int) -> None:
+        self._values = array("d", [0.0] * size)
+        self._index = 0
+        self._count = 0
+        self._total = 0.0
+        self.updated = 0.0
+
+    def add(self, value: float, timestamp: float) -> None:
+        """Push a reading, evicting the oldest one when the buffer is full."""
+        values = self._values
+        if self._count == len(values):
+            self._total -= values[self._index]
+        else:
+            self._count += 1
+        values[self._index] = value
+        self._total += value
+        self._index = (self._index + 1) % len(values)
+        self.updated = timestamp
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the buffered readings."""
+        return self._total / self._count
+
+
+class SensorAggregator:
+    """Smooth every sensor over its own window and combine the results.
+
+    Sources that have not reported within `stale_after` seconds are left
+    out, as long as at least one fresh source remains. With three or more
+    sources, those further than `outlier_threshold` from the median are left
+    out as well.
+    """
+
+    def __init__(
+        self,
+        entity_ids: list[str],
+        aggregate: str = AGGREGATE_MEAN,
+        window: int = 1,
+        outlier_threshold: float | None = None,
+        stale_after: float | None = None,
+    ) -> None:
+        self._windows = {entity_id: RollingWindow(window) for entity_id in entity_ids}
+        self._combine = _COMBINE[aggregate]
+        self._outlier_threshold = outlier_threshold
+        self._stale_after = stale_after
+        self._reported: dict[str, RollingWindow] = {}
+
+    def add(self, entity_id: str, value: float, timestamp: float) -> None:
+        """Record a reading from one of the sensors."""
+        window = self._windows[entity_id]
+        window.add(value, timestamp)
+        self._reported[entity_id] = window
+
+    def value(self, now: float) -> float | None:
+        """Return the combined temperature, or None before any reading."""
+        windows = self._reported.values()
+        if self._stale_after is not None:
+            fresh = [w for w in windows if now - w.updated <= self._stale_after]
+            if fresh:
+                windows = fresh
+        values = [window.mean for window in windows]
+        if not values:
+            return None
+        if self._outlier_threshold is not None and len(values) >= 3:
+            middle = median(values)
+            values = [
+                value
+                for value in values
+                if abs(value - middle) <= self._outlier_threshold
+            ] or [middle]
+        return self._combine(values)
@@ -1,11 +1,15 @@
 """Adds support for generic climate units."""
 
 import asyncio
+from functools import partial
 import logging
+from time import monotonic, perf_counter
+import zlib
 
 import voluptuous as vol
 
 from homeassistant.components.climate import (
+    DOMAIN as CLIMATE_DOMAIN,
     ClimateEntity,
     ClimateEntityFeature,
     HVACAction,
@@ -13,115 +17,258 @@ from homeassistant.components.climate import (
 )
 from homeassistant.components.climate.const import ATTR_PRESET_MODE, PRESET_AWAY, PRESET_NONE
 from homeassistant.const import (
-    ATTR_ENTITY_ID,
     ATTR_TEMPERATURE,
     CONF_NAME,
-    CONF_UNIQUE_ID,
+    CONF_PLATFORM,
     EVENT_HOMEASSISTANT_START,
-    PRECISION_HALVES,
-    PRECISION_TENTHS,
-    PRECISION_WHOLE,
     SERVICE_TURN_OFF,
     SERVICE_TURN_ON,
     STATE_ON,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import DOMAIN as HA_DOMAIN, CoreState, callback
-from homeassistant.helpers import condition
+from homeassistant.core import CoreState, SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import entity_platform
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_state_change_event,
-    async_track_time_interval,
+    async_track_state_report_event,
 )
 from homeassistant.helpers.reload import async_setup_reload_service
-from homeassistant.helpers.restore_state import RestoreEntity
-
-from . import DOMAIN, PLATFORMS
+from homeassistant.helpers.restore_state import RestoredExtraData, RestoreEntity
+from homeassistant.util import dt as dt_util
+
+from . import DOMAIN, async_get_coordinator
+from .aggregation import AGGREGATE_MEAN, SensorAggregator
+from .const import (
+    CONF_AWAY_TEMP,
+    CONF_COLD_TOLERANCE,
+    CONF_COOLER,
+    CONF_DECISION_TRACE,
+    CONF_DEMAND_WEIGHT,
+    CONF_ENTITY_UNIQUE_ID,
+    CONF_FAILSAFE_DUTY_CYCLE,
+    CONF_HEATER,
+    CONF_HOT_TOLERANCE,
+    CONF_HUMIDITY_SENSOR,
+    CONF_INITIAL_HVAC_MODE,
+    CONF_INSTRUMENTATION,
+    CONF_KEEP_ALIVE,
+    CONF_MAX_TEMP,
+    CONF_MIN_DUR,
+    CONF_MIN_TEMP,
+    CONF_OPEN_WINDOW_DROP,
+    CONF_OPEN_WINDOW_HOLD,
+    CONF_PLANT_MIN_CYCLE,
+    CONF_PLANT_SWITCH,
+    CONF_PRECISION,
+    CONF_PREDICTIVE_HORIZON,
+    CONF_SCHEDULE,
+    CONF_SCHEDULE_PREHEAT,
+    CONF_SENSOR,
+    CONF_SENSOR_AGGREGATE,
+    CONF_SENSOR_DEBOUNCE,
+    CONF_SENSOR_MAX_AGE,
+    CONF_SENSOR_OUTLIER_THRESHOLD,
+    CONF_SENSOR_STALE_AFTER,
+    CONF_SENSOR_WINDOW,
+    CONF_STATE_HUMIDITY_DELTA,
+    CONF_STATE_TEMPERATURE_DELTA,
+    CONF_TARGET_TEMP,
+    CONF_WARM_START,
+    CONF_ZONES,
+    DEFAULT_NAME,
+    DEFAULT_OPEN_WINDOW_HOLD,
+    DEFAULT_TOLERANCE,
+    DEFAULT_TRACE_SIZE,
+    ENTITY_OPTIONS,
+    RELOAD_OPTIONS,
+    ZONE_SCHEMA,
+    entry_config,
+)
+from .coordinator import (
+    DECISION_TURN_OFF,
+    DECISION_TURN_ON,
+    ZoneField,
+    ZoneModeField,
+)
+from .decision_trace import DecisionTrace
+from .instrumentation import (
+    OUTCOME_FAILSAFE,
+    OUTCOME_HOLD,
+    OUTCOME_INACTIVE,
+    OUTCOME_KEEP_ALIVE,
+    OUTCOME_MIN_CYCLE,
+    OUTCOME_OPEN_WINDOW,
+    OUTCOME_TURN_OFF,
+    OUTCOME_TURN_ON,
+    InstrumentedLock,
+    ZoneMetrics,
+)
+from .router import StateChangeRouter
+from .runtime_stats import WINDOW_24H, RuntimeStats
+from .schedule import WeeklySchedule
+from .slope import StreamingSlope
+from .thermal_model import ACTUATOR_COOL, ACTUATOR_HEAT, ACTUATOR_OFF, ThermalModel
+from .worker import LatestIntentWorker
 
 _LOGGER = logging.getLogger(__name__)
 
-DEFAULT_TOLERANCE = 0.3
-DEFAULT_NAME = "Generic Climate"
-
-CONF_HEATER = "heater"
-CONF_SENSOR = "target_sensor"
-CONF_MIN_TEMP = "min_temp"
-CONF_MAX_TEMP = "max_temp"
-CONF_TARGET_TEMP = "target_temp"
-CONF_MIN_DUR = "min_cycle_duration"
-CONF_COLD_TOLERANCE = "cold_tolerance"
-CONF_HOT_TOLERANCE = "hot_tolerance"
-CONF_KEEP_ALIVE = "keep_alive"
-CONF_INITIAL_HVAC_MODE = "initial_hvac_mode"
-CONF_AWAY_TEMP = "away_temp"
-CONF_PRECISION = "precision"
 SUPPORT_FLAGS = ClimateEntityFeature.TARGET_TEMPERATURE
 
-CONF_COOLER = "cooler"
-CONF_HUMIDITY_SENSOR = "humidity_sensor"
-CONF_ENTITY_UNIQUE_ID = CONF_UNIQUE_ID
-
-PLATFORM_SCHEMA = cv.PLATFORM_SCHEMA.extend(
-    {
-        vol.Required(CONF_HEATER): cv.entity_id,
-        vol.Required(CONF_SENSOR): cv.entity_id,
-        vol.Optional(CONF_ENTITY_UNIQUE_ID): cv.string,
-        vol.Optional(CONF_MAX_TEMP): vol.Coerce(float),
-        vol.Optional(CONF_MIN_DUR): cv.positive_time_period,
-        vol.Optional(CONF_MIN_TEMP): vol.Coerce(float),
-        vol.Optional(CONF_NAME, default=DEFAULT_NAME): cv.string,
-        vol.Optional(CONF_COLD_TOLERANCE, default=DEFAULT_TOLERANCE): vol.Coerce(float),
-        vol.Optional(CONF_HOT_TOLERANCE, default=DEFAULT_TOLERANCE): vol.Coerce(float),
-        vol.Optional(CONF_TARGET_TEMP): vol.Coerce(float),
-        vol.Optional(CONF_KEEP_ALIVE): cv.positive_time_period,
-        vol.Optional(CONF_INITIAL_HVAC_MODE): vol.In(
-            [HVACMode.COOL, HVACMode.HEAT, HVACMode.OFF]
-        ),
-        vol.Optional(CONF_AWAY_TEMP): vol.Coerce(float),
-        vol.Optional(CONF_PRECISION): vol.In(
-            [PRECISION_TENTHS, PRECISION_HALVES, PRECISION_WHOLE]
-        ),
-        vol.Optional(CONF_COOLER): cv.entity_id,
-        vol.Optional(CONF_HUMIDITY_SENSOR): cv.entity_id,
-    }
+# Unparsable sensor states are logged at most once per interval per sensor.
+PARSE_ERROR_LOG_INTERVAL = 600
+# Seconds to wait for a switch to report a commanded state before resending;
+# the wait doubles with every retry.
+COMMAND_TIMEOUT = 10
+COMMAND_RETRIES = 3
+# Length of one on/off cycle while running a failsafe duty cycle, in seconds.
+FAILSAFE_CYCLE = 1200
+# Open windows are told from the slope of the last few readings, spanning
+# at least a minute so a single sensor step does not look like a draught.
+OPEN_WINDOW_SAMPLES = 5
+OPEN_WINDOW_MIN_SPAN = 60
+# Readings closer together are skipped, so that the samples of a sensor
+# reporting every few seconds still span OPEN_WINDOW_MIN_SPAN.
+OPEN_WINDOW_SPACING = OPEN_WINDOW_MIN_SPAN / (OPEN_WINDOW_SAMPLES - 1)
+
+ATTR_COALESCED_SENSOR_EVENTS = "coalesced_sensor_events"
+ATTR_DEGRADED = "degraded"
+ATTR_RUNTIME_24H = "runtime_24h"
+ATTR_SENSOR_STALE = "sensor_stale"
+ATTR_WINDOW_OPEN = "window_open"
+
+SERVICE_DUMP_DECISION_TRACE = "dump_decision_trace"
+
+RESTORE_HEATER_ON = "heater_on"
+RESTORE_HEATER_LAST_CHANGED = "heater_last_changed"
+RESTORE_COOLER_ON = "cooler_on"
+RESTORE_COOLER_LAST_CHANGED = "cooler_last_changed"
+RESTORE_THERMAL_MODEL = "thermal_model"
+RESTORE_RUNTIME_STATS = "runtime_stats"
+RESTORE_CURRENT_TEMPERATURE = "current_temperature"
+RESTORE_TEMPERATURE_UPDATED = "temperature_updated"
+
+
+def _validate_zones(config):
+    """Require heater and target_sensor on the platform or on every zone."""
+    zones = config.get(CONF_ZONES) or [{}]
+    for zone in zones:
+        zone_config = {**config, **zone}
+        for key in (CONF_HEATER, CONF_SENSOR):
+            if not zone_config.get(key):
+                raise vol.Invalid(f"required key not provided: {key}")
+    return config
+
+
+PLATFORM_SCHEMA = vol.All(
+    cv.PLATFORM_SCHEMA.extend(
+        {
+            **ENTITY_OPTIONS,
+            vol.Optional(CONF_ZONES): vol.All(cv.ensure_list, [ZONE_SCHEMA]),
+        }
+    ),
+    _validate_zones,
 )
 
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up the Generic Climate platform from a config entry."""
-    data = {**config_entry.data, **config_entry.options}
-
-    async_add_entities(
-        [
-            GenericClimate(
-                name=data.get(CONF_NAME, DEFAULT_NAME),
-                unique_id=data.get(CONF_ENTITY_UNIQUE_ID),
-                heater_entity_id=data.get(CONF_HEATER),
-                sensor_entity_id=data.get(CONF_SENSOR),
-                min_temp=data.get(CONF_MIN_TEMP),
-                max_temp=data.get(CONF_MAX_TEMP),
-                target_temp=data.get(CONF_TARGET_TEMP),
-                min_cycle_duration=data.get(CONF_MIN_DUR),
-                cold_tolerance=data.get(CONF_COLD_TOLERANCE, DEFAULT_TOLERANCE),
-                hot_tolerance=data.get(CONF_HOT_TOLERANCE, DEFAULT_TOLERANCE),
-                keep_alive=data.get(CONF_KEEP_ALIVE),
-                initial_hvac_mode=data.get(CONF_INITIAL_HVAC_MODE),
-                away_temp=data.get(CONF_AWAY_TEMP),
-                precision=data.get(CONF_PRECISION),
-                unit=hass.config.units.temperature_unit,
-                cooler_entity_id=data.get(CONF_COOLER),
-                humidity_entity_id=data.get(CONF_HUMIDITY_SENSOR),
-            )
-        ]
+    data = entry_config(config_entry)
+    coordinator = async_get_coordinator(hass)
+
+    entity = GenericClimate(
+        name=data.get(CONF_NAME, DEFAULT_NAME),
+        unique_id=data.get(CONF_ENTITY_UNIQUE_ID),
+        heater_entity_id=data.get(CONF_HEATER),
+        sensor_entity_id=data.get(CONF_SENSOR),
+        min_temp=data.get(CONF_MIN_TEMP),
+        max_temp=data.get(CONF_MAX_TEMP),
+        target_temp=data.get(CONF_TARGET_TEMP),
+        min_cycle_duration=data.get(CONF_MIN_DUR),
+        cold_tolerance=data.get(CONF_COLD_TOLERANCE, DEFAULT_TOLERANCE),
+        hot_tolerance=data.get(CONF_HOT_TOLERANCE, DEFAULT_TOLERANCE),
+        keep_alive=data.get(CONF_KEEP_ALIVE),
+        initial_hvac_mode=data.get(CONF_INITIAL_HVAC_MODE),
+        away_temp=data.get(CONF_AWAY_TEMP),
+        precision=data.get(CONF_PRECISION),
+        unit=hass.config.units.temperature_unit,
+        cooler_entity_id=data.get(CONF_COOLER),
+        humidity_entity_id=data.get(CONF_HUMIDITY_SENSOR),
+        sensor_debounce=data.get(CONF_SENSOR_DEBOUNCE),
+        predictive_horizon=data.get(CONF_PREDICTIVE_HORIZON),
+        instrumentation=data.get(CONF_INSTRUMENTATION, False),
+        sensor_aggregate=data.get(CONF_SENSOR_AGGREGATE) or AGGREGATE_MEAN,
+        sensor_window=data.get(CONF_SENSOR_WINDOW) or 1,
+        sensor_outlier_threshold=data.get(CONF_SENSOR_OUTLIER_THRESHOLD),
+        sensor_stale_after=data.get(CONF_SENSOR_STALE_AFTER),
+        state_temperature_delta=data.get(CONF_STATE_TEMPERATURE_DELTA),
+        state_humidity_delta=data.get(CONF_STATE_HUMIDITY_DELTA),
+        warm_start=data.get(CONF_WARM_START),
+        sensor_max_age=data.get(CONF_SENSOR_MAX_AGE),
+        failsafe_duty_cycle=data.get(CONF_FAILSAFE_DUTY_CYCLE),
+        schedule=data.get(CONF_SCHEDULE),
+        schedule_preheat=data.get(CONF_SCHEDULE_PREHEAT),
+        decision_trace=data.get(CONF_DECISION_TRACE),
+        plant_switch=data.get(CONF_PLANT_SWITCH),
+        plant_min_cycle=data.get(CONF_PLANT_MIN_CYCLE),
+        demand_weight=data.get(CONF_DEMAND_WEIGHT),
+        open_window_drop=data.get(CONF_OPEN_WINDOW_DROP),
+        open_window_hold=data.get(CONF_OPEN_WINDOW_HOLD),
+        state_router=None,
+        coordinator=coordinator,
     )
+    entity.config_data = data
+    coordinator.entities[config_entry.entry_id] = entity
+    _async_register_services()
+    async_add_entities([entity])
 
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up the generic climate platform."""
 
-    await async_setup_reload_service(hass, DOMAIN, PLATFORMS)
+    await async_setup_reload_service(hass, DOMAIN, [CLIMATE_DOMAIN])
+
+    coordinator = async_get_coordinator(hass)
+    _async_register_services()
+    if not (zones := config.get(CONF_ZONES)):
+        async_add_entities([_create_entity(hass, config, coordinator, None)])
+        return
+
+    # Zones inherit every setting of the platform block they don't override
+    # and share one state change subscription.
+    shared = {
+        key: value
+        for key, value in config.items()
+        if key not in (CONF_PLATFORM, CONF_ZONES, CONF_ENTITY_UNIQUE_ID)
+    }
+    zone_configs = [{**shared, **zone} for zone in zones]
+    router = StateChangeRouter(
+        hass,
+        {
+            entity_id
+            for zone_config in zone_configs
+            for entity_id in (
+                zone_config[CONF_HEATER],
+                zone_config.get(CONF_COOLER),
+                zone_config.get(CONF_HUMIDITY_SENSOR),
+                *zone_config[CONF_SENSOR],
+            )
+            if entity_id
+        },
+    )
+    async_add_entities(
+        [
+            _create_entity(hass, zone_config, coordinator, router)
+            for zone_config in zone_configs
+        ]
+    )
+
 
+def _create_entity(hass, config, coordinator, state_router):
+    """Create a thermostat from a validated YAML platform or zone config."""
     name = config.get(CONF_NAME)
     unique_id = config.get(CONF_ENTITY_UNIQUE_ID)
     heater_entity_id = config.get(CONF_HEATER)
@@ -140,35 +287,124 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 
     cooler_entity_id = config.get(CONF_COOLER)
     humidity_entity_id = config.get(CONF_HUMIDITY_SENSOR)
+    sensor_debounce = config.get(CONF_SENSOR_DEBOUNCE)
+    predictive_horizon = config.get(CONF_PREDICTIVE_HORIZON)
+    instrumentation = config.get(CONF_INSTRUMENTATION)
+    sensor_aggregate = config.get(CONF_SENSOR_AGGREGATE)
+    sensor_window = config.get(CONF_SENSOR_WINDOW)
+    sensor_outlier_threshold = config.get(CONF_SENSOR_OUTLIER_THRESHOLD)
+    sensor_stale_after = config.get(CONF_SENSOR_STALE_AFTER)
+    state_temperature_delta = config.get(CONF_STATE_TEMPERATURE_DELTA)
+    state_humidity_delta = config.get(CONF_STATE_HUMIDITY_DELTA)
+    warm_start = config.get(CONF_WARM_START)
+    sensor_max_age = config.get(CONF_SENSOR_MAX_AGE)
+    failsafe_duty_cycle = config.get(CONF_FAILSAFE_DUTY_CYCLE)
+    schedule = config.get(CONF_SCHEDULE)
+    schedule_preheat = config.get(CONF_SCHEDULE_PREHEAT)
+    decision_trace = config.get(CONF_DECISION_TRACE)
+    plant_switch = config.get(CONF_PLANT_SWITCH)
+    plant_min_cycle = config.get(CONF_PLANT_MIN_CYCLE)
+    demand_weight = config.get(CONF_DEMAND_WEIGHT)
+    open_window_drop = config.get(CONF_OPEN_WINDOW_DROP)
+    open_window_hold = config.get(CONF_OPEN_WINDOW_HOLD)
+
+    return GenericClimate(
+        name=name,
+        unique_id=unique_id,
+        heater_entity_id=heater_entity_id,
+        sensor_entity_id=sensor_entity_id,
+        min_temp=min_temp,
+        max_temp=max_temp,
+        target_temp=target_temp,
+        min_cycle_duration=min_cycle_duration,
+        cold_tolerance=cold_tolerance,
+        hot_tolerance=hot_tolerance,
+        keep_alive=keep_alive,
+        initial_hvac_mode=initial_hvac_mode,
+        away_temp=away_temp,
+        precision=precision,
+        unit=unit,
+        cooler_entity_id=cooler_entity_id,
+        humidity_entity_id=humidity_entity_id,
+        sensor_debounce=sensor_debounce,
+        predictive_horizon=predictive_horizon,
+        instrumentation=instrumentation,
+        sensor_aggregate=sensor_aggregate,
+        sensor_window=sensor_window,
+        sensor_outlier_threshold=sensor_outlier_threshold,
+        sensor_stale_after=sensor_stale_after,
+        state_temperature_delta=state_temperature_delta,
+        state_humidity_delta=state_humidity_delta,
+        warm_start=warm_start,
+        sensor_max_age=sensor_max_age,
+        failsafe_duty_cycle=failsafe_duty_cycle,
+        schedule=schedule,
+        schedule_preheat=schedule_preheat,
+        decision_trace=decision_trace,
+        plant_switch=plant_switch,
+        plant_min_cycle=plant_min_cycle,
+        demand_weight=demand_weight,
+        open_window_drop=open_window_drop,
+        open_window_hold=open_window_hold,
+        state_router=state_router,
+        coordinator=coordinator,
+    )
 
-    async_add_entities(
-        [
-            GenericClimate(
-                name=name,
-                unique_id=unique_id,
-                heater_entity_id=heater_entity_id,
-                sensor_entity_id=sensor_entity_id,
-                min_temp=min_temp,
-                max_temp=max_temp,
-                target_temp=target_temp,
-                min_cycle_duration=min_cycle_duration,
-                cold_tolerance=cold_tolerance,
-                hot_tolerance=hot_tolerance,
-                keep_alive=keep_alive,
-                initial_hvac_mode=initial_hvac_mode,
-                away_temp=away_temp,
-                precision=precision,
-                unit=unit,
-                cooler_entity_id=cooler_entity_id,
-                humidity_entity_id=humidity_entity_id,
-            )
-        ]
+
+@callback
+def _async_register_services():
+    """Register the entity services on the platform being set up."""
+    entity_platform.async_get_current_platform().async_register_entity_service(
+        SERVICE_DUMP_DECISION_TRACE,
+        {},
+        "async_dump_decision_trace",
+        supports_response=SupportsResponse.ONLY,
     )
 
 
+def _moved(old, new, delta):
+    """Return True if a reading moved from old to new by at least delta."""
+    if old is None or new is None or not delta:
+        return old != new
+    return abs(new - old) >= delta
+
+
+async def async_update_entry_options(hass, config_entry):
+    """Apply updated options to the running entity of a config entry.
+
+    Returns False when the entity has to be recreated instead.
+    """
+    entity = async_get_coordinator(hass).entities.get(config_entry.entry_id)
+    if entity is None or entity.hass is None:
+        return False
+
+    data = entry_config(config_entry)
+    old_data = entity.config_data
+    changed = {
+        key for key in data.keys() | old_data.keys() if data.get(key) != old_data.get(key)
+    }
+    if changed & RELOAD_OPTIONS:
+        return False
+
+    entity.config_data = data
+    if changed:
+        await entity.async_apply_config(data, changed)
+    return True
+
+
 class GenericClimate(ClimateEntity, RestoreEntity):
     """Representation of a Generic Climate device."""
 
+    # Control state lives in the shared coordinator; these read and write
+    # this zone's slot.
+    _cur_temp = ZoneField("cur_temp")
+    _target_temp = ZoneField("target_temp")
+    _cold_tolerance = ZoneField("cold_tolerance")
+    _hot_tolerance = ZoneField("hot_tolerance")
+    _hvac_mode = ZoneModeField("hvac_mode")
+    _device_active = ZoneField("device_active")
+    _predicted_delta = ZoneField("predicted_delta")
+
     def __init__(
         self,
         name,
@@ -188,12 +424,55 @@ class GenericClimate(ClimateEntity, RestoreEntity):
         unit,
         cooler_entity_id,
         humidity_entity_id,
+        sensor_debounce,
+        predictive_horizon,
+        instrumentation,
+        sensor_aggregate,
+        sensor_window,
+        sensor_outlier_threshold,
+        sensor_stale_after,
+        state_temperature_delta,
+        state_humidity_delta,
+        warm_start,
+        sensor_max_age,
+        failsafe_duty_cycle,
+        schedule,
+        schedule_preheat,
+        decision_trace,
+        plant_switch,
+        plant_min_cycle,
+        demand_weight,
+        open_window_drop,
+        open_window_hold,
+        state_router,
+        coordinator,
     ):
         """Initialize the thermostat."""
+        self._coordinator = coordinator
+        # Set for zones from a config entry, which get runtime sensors.
+        self.config_data = None
+        # The coordinator slot is held only while the entity is added.
+        self._zone = None
+        self._zone_values = {}
         self._name = name
         self._attr_unique_id = unique_id
         self.heater_entity_id = heater_entity_id
-        self.sensor_entity_id = sensor_entity_id
+        if isinstance(sensor_entity_id, str):
+            sensor_entity_id = [sensor_entity_id]
+        self.sensor_entity_ids = list(sensor_entity_id)
+        self.sensor_entity_id = self.sensor_entity_ids[0]
+        self._sensor_aggregator = SensorAggregator(
+            self.sensor_entity_ids,
+            aggregate=sensor_aggregate or AGGREGATE_MEAN,
+            window=sensor_window or 1,
+            outlier_threshold=sensor_outlier_threshold,
+            stale_after=(
+                sensor_stale_after.total_seconds() if sensor_stale_after else None
+            ),
+        )
+        self._parse_errors = {}
+        self._unsubs = {}
+        self._state_router = state_router
         self.min_cycle_duration = min_cycle_duration
         self._cold_tolerance = cold_tolerance
         self._hot_tolerance = hot_tolerance
@@ -203,15 +482,57 @@ class GenericClimate(ClimateEntity, RestoreEntity):
         self._temp_precision = precision
         self._cooler_entity_id = cooler_entity_id
         self.humidity_entity_id = humidity_entity_id
+        self._sensor_debounce = sensor_debounce
+        self._sensor_debounce_unsub = None
+        self._coalesced_sensor_events = 0
+        self._predictive_horizon = predictive_horizon
+        self._thermal_model = ThermalModel() if predictive_horizon else None
         self._hvac_list = [HVACMode.OFF]
         if self._cooler_entity_id:
             self._hvac_list.append(HVACMode.COOL)
         if self.heater_entity_id:
             self._hvac_list.append(HVACMode.HEAT)
         self._active = False
+        self._heater_on = False
+        self._cooler_on = False
+        self._heater_last_changed = None
+        self._cooler_last_changed = None
+        self._runtime_stats = {
+            ACTUATOR_HEAT: RuntimeStats(),
+            ACTUATOR_COOL: RuntimeStats(),
+        }
+        self._commands = {}
+        self._degraded = False
         self._cur_temp = None
+        self._temp_updated = None
+        self._temp_restored = False
+        self._warm_start = warm_start
+        self._sensor_max_age = sensor_max_age
+        self._failsafe_duty_cycle = failsafe_duty_cycle
+        self._sensor_stale = False
+        self._open_window_drop = open_window_drop
+        self._open_window_hold = open_window_hold or DEFAULT_OPEN_WINDOW_HOLD
+        self._temp_slope = StreamingSlope(OPEN_WINDOW_SAMPLES)
+        self._window_open = False
+        self._schedule = (
+            WeeklySchedule(schedule, schedule_preheat) if schedule else None
+        )
         self._cur_hum = None
+        self._state_temperature_delta = state_temperature_delta
+        self._state_humidity_delta = state_humidity_delta
+        self._written_state = None
+        self._suppressed_writes = 0
+        self._metrics = ZoneMetrics() if instrumentation else None
+        if decision_trace is None:
+            decision_trace = DEFAULT_TRACE_SIZE
+        self._trace = DecisionTrace(decision_trace) if decision_trace else None
+        self._plant = coordinator.async_get_plant(plant_switch)
+        self._plant_min_cycle = plant_min_cycle
+        self._demand_weight = 1.0 if demand_weight is None else demand_weight
+        self._decision_pending_since = None
         self._temp_lock = asyncio.Lock()
+        if self._metrics is not None:
+            self._temp_lock = InstrumentedLock(self._temp_lock, self._metrics.lock_wait)
         self._min_temp = min_temp
         self._max_temp = max_temp
         self._target_temp = target_temp
@@ -225,42 +546,38 @@ class GenericClimate(ClimateEntity, RestoreEntity):
     async def async_added_to_hass(self):
         """Run when entity about to be added."""
         await super().async_added_to_hass()
+        self._zone = self._coordinator.async_add_zone(self._zone_values)
+        self._control_worker = LatestIntentWorker(self.hass, self._async_run_control)
 
-        # Add listener
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass, [self.sensor_entity_id], self._async_sensor_changed
-            )
-        )
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass, [self.heater_entity_id], self._async_switch_changed
-            )
+        # On a re-add the heater keeps its cached state, so no change event
+        # would report it calling.
+        self._plant.async_join(
+            self, self._demand_weight, self._plant_min_cycle, self._heater_on
         )
-        if(self.humidity_entity_id):
-            self.async_on_remove(
-                async_track_state_change_event(
-                    self.hass, [self.humidity_entity_id], self._async_humidity_sensor_changed
-                )
-            )
 
-        if self._keep_alive:
-            self.async_on_remove(
-                async_track_time_interval(
-                    self.hass, self._async_control_heating_cooling, self._keep_alive
-                )
-            )
+        # Add listener
+        self._async_subscribe_sensors()
+        self._async_subscribe_switches()
+        self._async_subscribe_humidity()
+        self._async_schedule_keep_alive()
+        self.async_on_remove(self._async_unsubscribe)
+        # A sensor that never reports trips the watchdog as well.
+        self._async_arm_watchdog(dt_util.utcnow())
 
         @callback
         def _async_startup(*_):
             """Init on startup."""
-            sensor_state = self.hass.states.get(self.sensor_entity_id)
-            if sensor_state and sensor_state.state not in (
-                STATE_UNAVAILABLE,
-                STATE_UNKNOWN,
-            ):
-                self._async_update_temp(sensor_state)
-                self.async_write_ha_state()
+            updated = False
+            for sensor_entity_id in self.sensor_entity_ids:
+                sensor_state = self.hass.states.get(sensor_entity_id)
+                if sensor_state and sensor_state.state not in (
+                    STATE_UNAVAILABLE,
+                    STATE_UNKNOWN,
+                ):
+                    self._async_update_temp(sensor_state)
+                    updated = True
+            if updated:
+                self._async_write_state()
 
         if self.hass.state == CoreState.running:
             _async_startup()
@@ -269,7 +586,9 @@ class GenericClimate(ClimateEntity, RestoreEntity):
                 EVENT_HOMEASSISTANT_START, _async_startup)
 
         # Check If we have an old state
-        old_state = await self.async_get_last_state()
+        restored = self._coordinator.async_restored(self.entity_id)
+        old_state = restored.state if restored is not None else None
+        last_extra_data = restored.extra_data if restored is not None else None
         if old_state is not None:
             # If we have no initial temperature, restore
             if self._target_temp is None:
@@ -299,10 +618,294 @@ class GenericClimate(ClimateEntity, RestoreEntity):
                 "No previously saved temperature, setting to %s", self._target_temp
             )
 
+        # Restore actuator transition times so min_cycle_duration also
+        # holds across restarts.
+        warm_started = False
+        if last_extra_data is not None:
+            data = last_extra_data.as_dict()
+            warm_started = self._async_warm_start(data)
+            self._async_restore_transitions(data)
+
         # Set default state to off
         if not self._hvac_mode:
             self._hvac_mode = HVACMode.OFF
 
+        # The schedule takes precedence over the restored setpoint.
+        self._async_apply_schedule()
+
+        if warm_started:
+            # Control from the restored state until the sensors report.
+            self.hass.async_create_task(self._async_control_heating_cooling())
+
+    @callback
+    def _async_track(self, key, unsub):
+        """Store a subscription under key, cancelling the one it replaces."""
+        if (old_unsub := self._unsubs.pop(key, None)) is not None:
+            old_unsub()
+        if unsub is not None:
+            self._unsubs[key] = unsub
+
+    @callback
+    def _async_unsubscribe(self):
+        """Cancel every subscription of the entity."""
+        while self._unsubs:
+            self._unsubs.popitem()[1]()
+
+    @callback
+    def _async_track_state_change(self, entity_ids, action):
+        """Subscribe to state changes, through the zone router if there is one."""
+        if self._state_router is not None:
+            return self._state_router.async_track(entity_ids, action)
+        return async_track_state_change_event(self.hass, entity_ids, action)
+
+    @callback
+    def _async_subscribe_sensors(self):
+        """Listen to the target sensors."""
+        self._async_track(
+            CONF_SENSOR,
+            self._async_track_state_change(
+                self.sensor_entity_ids, self._async_sensor_changed
+            ),
+        )
+        self._async_subscribe_sensor_reports()
+
+    @callback
+    def _async_subscribe_sensor_reports(self):
+        """Feed the watchdog with sensors reporting an unchanged reading.
+
+        Home Assistant fires no state change for a repeated value, only
+        updating `last_reported`, so a steady room would look silent.
+        """
+        self._async_track(
+            CONF_SENSOR_MAX_AGE,
+            async_track_state_report_event(
+                self.hass, self.sensor_entity_ids, self._async_sensor_reported
+            )
+            if self._sensor_max_age
+            else None,
+        )
+
+    @callback
+    def _async_subscribe_switches(self):
+        """Listen to the heater and cooler and seed their cached state."""
+        switch_entity_ids = [self.heater_entity_id]
+        if self._cooler_entity_id:
+            switch_entity_ids.append(self._cooler_entity_id)
+        self._async_track(
+            CONF_HEATER,
+            self._async_track_state_change(
+                switch_entity_ids, self._async_switch_changed
+            ),
+        )
+        for entity_id in switch_entity_ids:
+            self._async_update_device_state(entity_id, self.hass.states.get(entity_id))
+
+    @callback
+    def _async_subscribe_humidity(self):
+        """Listen to the humidity sensor, if any."""
+        self._async_track(
+            CONF_HUMIDITY_SENSOR,
+            self._async_track_state_change(
+                [self.humidity_entity_id], self._async_humidity_sensor_changed
+            )
+            if self.humidity_entity_id
+            else None,
+        )
+
+    @callback
+    def _async_schedule_keep_alive(self):
+        """Register the keep-alive tick, if any."""
+        # Keep-alive ticks of all zones share one scheduler and are
+        # spread over the interval.
+        self._async_track(
+            CONF_KEEP_ALIVE,
+            self._coordinator.scheduler.async_track_interval(
+                (self, CONF_KEEP_ALIVE),
+                self.entity_id,
+                self._keep_alive,
+                self._async_keep_alive,
+            )
+            if self._keep_alive
+            else None,
+        )
+
+    async def async_apply_config(self, data, changed):
+        """Apply changed config entry options to the running entity.
+
+        Only subscriptions whose entity ids changed are re-created; runtime
+        state such as the coordinator slot, cached actuator state and learned
+        thermal model is kept.
+        """
+        if CONF_NAME in changed:
+            self._name = data.get(CONF_NAME, DEFAULT_NAME)
+        if CONF_MIN_TEMP in changed:
+            self._min_temp = data.get(CONF_MIN_TEMP)
+        if CONF_MAX_TEMP in changed:
+            self._max_temp = data.get(CONF_MAX_TEMP)
+        if CONF_PRECISION in changed:
+            self._temp_precision = data.get(CONF_PRECISION)
+        if CONF_MIN_DUR in changed:
+            self.min_cycle_duration = data.get(CONF_MIN_DUR)
+        if CONF_COLD_TOLERANCE in changed:
+            self._cold_tolerance = data.get(CONF_COLD_TOLERANCE, DEFAULT_TOLERANCE)
+        if CONF_HOT_TOLERANCE in changed:
+            self._hot_tolerance = data.get(CONF_HOT_TOLERANCE, DEFAULT_TOLERANCE)
+        if CONF_SENSOR_DEBOUNCE in changed:
+            self._sensor_debounce = data.get(CONF_SENSOR_DEBOUNCE)
+        if CONF_STATE_TEMPERATURE_DELTA in changed:
+            self._state_temperature_delta = data.get(CONF_STATE_TEMPERATURE_DELTA)
+        if CONF_STATE_HUMIDITY_DELTA in changed:
+            self._state_humidity_delta = data.get(CONF_STATE_HUMIDITY_DELTA)
+        if CONF_WARM_START in changed:
+            self._warm_start = data.get(CONF_WARM_START)
+        if CONF_FAILSAFE_DUTY_CYCLE in changed:
+            self._failsafe_duty_cycle = data.get(CONF_FAILSAFE_DUTY_CYCLE)
+        if CONF_DECISION_TRACE in changed:
+            # As in the constructor: unset means the default, only 0 disables.
+            size = data.get(CONF_DECISION_TRACE)
+            if size is None:
+                size = DEFAULT_TRACE_SIZE
+            self._trace = DecisionTrace(size) if size else None
+        if changed & {CONF_PLANT_MIN_CYCLE, CONF_DEMAND_WEIGHT}:
+            self._plant_min_cycle = data.get(CONF_PLANT_MIN_CYCLE)
+            weight = data.get(CONF_DEMAND_WEIGHT)
+            self._demand_weight = 1.0 if weight is None else weight
+            self._plant.async_join(
+                self, self._demand_weight, self._plant_min_cycle, self._heater_on
+            )
+        if changed & {CONF_SCHEDULE, CONF_SCHEDULE_PREHEAT}:
+            schedule = data.get(CONF_SCHEDULE)
+            self._schedule = (
+                WeeklySchedule(schedule, data.get(CONF_SCHEDULE_PREHEAT))
+                if schedule
+                else None
+            )
+            self._async_apply_schedule()
+        if CONF_OPEN_WINDOW_HOLD in changed:
+            self._open_window_hold = (
+                data.get(CONF_OPEN_WINDOW_HOLD) or DEFAULT_OPEN_WINDOW_HOLD
+            )
+        if CONF_OPEN_WINDOW_DROP in changed:
+            self._open_window_drop = data.get(CONF_OPEN_WINDOW_DROP)
+            self._async_end_window_hold()
+        if CONF_SENSOR_MAX_AGE in changed:
+            self._sensor_max_age = data.get(CONF_SENSOR_MAX_AGE)
+            self._async_subscribe_sensor_reports()
+            self._async_arm_watchdog(self._temp_updated or dt_util.utcnow())
+
+        if CONF_TARGET_TEMP in changed and data.get(CONF_TARGET_TEMP) is not None:
+            if self._is_away:
+                self._saved_target_temp = data[CONF_TARGET_TEMP]
+            else:
+                self._target_temp = data[CONF_TARGET_TEMP]
+        if CONF_AWAY_TEMP in changed:
+            self._away_temp = data.get(CONF_AWAY_TEMP)
+            if self._away_temp:
+                self._support_flags |= ClimateEntityFeature.PRESET_MODE
+                if self._is_away:
+                    self._target_temp = self._away_temp
+            else:
+                self._support_flags &= ~ClimateEntityFeature.PRESET_MODE
+                if self._is_away:
+                    self._is_away = False
+                    self._target_temp = self._saved_target_temp
+
+        if CONF_PREDICTIVE_HORIZON in changed:
+            self._predictive_horizon = data.get(CONF_PREDICTIVE_HORIZON)
+            if not self._predictive_horizon:
+                self._thermal_model = None
+                self._predicted_delta = 0.0
+            elif self._thermal_model is None:
+                self._thermal_model = ThermalModel()
+
+        if changed & {
+            CONF_SENSOR,
+            CONF_SENSOR_AGGREGATE,
+            CONF_SENSOR_WINDOW,
+            CONF_SENSOR_OUTLIER_THRESHOLD,
+            CONF_SENSOR_STALE_AFTER,
+        }:
+            sensor_entity_ids = data.get(CONF_SENSOR)
+            if isinstance(sensor_entity_ids, str):
+                sensor_entity_ids = [sensor_entity_ids]
+            self.sensor_entity_ids = list(sensor_entity_ids)
+            self.sensor_entity_id = self.sensor_entity_ids[0]
+            stale_after = data.get(CONF_SENSOR_STALE_AFTER)
+            self._sensor_aggregator = SensorAggregator(
+                self.sensor_entity_ids,
+                aggregate=data.get(CONF_SENSOR_AGGREGATE) or AGGREGATE_MEAN,
+                window=data.get(CONF_SENSOR_WINDOW) or 1,
+                outlier_threshold=data.get(CONF_SENSOR_OUTLIER_THRESHOLD),
+                stale_after=stale_after.total_seconds() if stale_after else None,
+            )
+            if CONF_SENSOR in changed:
+                self._async_subscribe_sensors()
+            for sensor_entity_id in self.sensor_entity_ids:
+                sensor_state = self.hass.states.get(sensor_entity_id)
+                if sensor_state and sensor_state.state not in (
+                    STATE_UNAVAILABLE,
+                    STATE_UNKNOWN,
+                ):
+                    self._async_update_temp(sensor_state)
+
+        if changed & {CONF_HEATER, CONF_COOLER}:
+            # Leave a replaced actuator switched off.
+            if CONF_HEATER in changed and self._heater_on:
+                await self._async_heater_turn_off()
+            if CONF_COOLER in changed and self._cooler_on:
+                await self._async_cooler_turn_off()
+            self.heater_entity_id = data.get(CONF_HEATER)
+            self._cooler_entity_id = data.get(CONF_COOLER)
+            now = dt_util.utcnow().timestamp()
+            for stats in self._runtime_stats.values():
+                stats.transition(False, now)
+            self._plant.async_set_calling(self, False)
+            self._heater_on = self._cooler_on = False
+            self._heater_last_changed = self._cooler_last_changed = None
+            # The replaced actuators no longer report to this entity.
+            for entity_id in list(self._commands):
+                if entity_id not in (self.heater_entity_id, self._cooler_entity_id):
+                    self._async_command_confirmed(entity_id)
+            self._hvac_list = [HVACMode.OFF]
+            if self._cooler_entity_id:
+                self._hvac_list.append(HVACMode.COOL)
+            if self.heater_entity_id:
+                self._hvac_list.append(HVACMode.HEAT)
+            if self._hvac_mode not in self._hvac_list:
+                self._hvac_mode = HVACMode.OFF
+            self._async_subscribe_switches()
+
+        if CONF_HUMIDITY_SENSOR in changed:
+            self.humidity_entity_id = data.get(CONF_HUMIDITY_SENSOR)
+            self._cur_hum = None
+            self._async_subscribe_humidity()
+
+        if CONF_KEEP_ALIVE in changed:
+            self._keep_alive = data.get(CONF_KEEP_ALIVE)
+            self._async_schedule_keep_alive()
+
+        await self._async_control_heating_cooling(force=True)
+        self._async_write_state()
+
+    async def async_will_remove_from_hass(self):
+        """Release the coordinator slot when the entity is removed."""
+        await super().async_will_remove_from_hass()
+        if self._sensor_debounce_unsub is not None:
+            self._sensor_debounce_unsub()
+            self._sensor_debounce_unsub = None
+        self._coordinator.scheduler.async_cancel((self, CONF_WARM_START))
+        self._coordinator.scheduler.async_cancel((self, CONF_SENSOR_MAX_AGE))
+        self._coordinator.scheduler.async_cancel((self, CONF_SCHEDULE))
+        self._coordinator.scheduler.async_cancel((self, CONF_FAILSAFE_DUTY_CYCLE))
+        self._coordinator.scheduler.async_cancel((self, CONF_OPEN_WINDOW_HOLD))
+        for entity_id in list(self._commands):
+            self._async_command_confirmed(entity_id)
+        self._plant.async_leave(self)
+        # Keep the zone's settings and state for when it is added again,
+        # e.g. after its entity_id is renamed.
+        self._zone_values = self._coordinator.async_remove_zone(self._zone)
+        self._zone = None
+
     @property
     def should_poll(self):
         """Return the polling state."""
@@ -345,6 +948,35 @@ class GenericClimate(ClimateEntity, RestoreEntity):
         """Return the sensor humidity."""
         return self._cur_hum
 
+    @property
+    def extra_state_attributes(self):
+        """Return entity specific state attributes."""
+        attributes = {ATTR_DEGRADED: self._degraded}
+        if self._sensor_max_age:
+            attributes[ATTR_SENSOR_STALE] = self._sensor_stale
+        if self._open_window_drop:
+            attributes[ATTR_WINDOW_OPEN] = self._window_open
+        if self._sensor_debounce:
+            attributes[ATTR_COALESCED_SENSOR_EVENTS] = self._coalesced_sensor_events
+        if self.config_data is None:
+            # YAML zones have no runtime sensors; summarize the last day here.
+            now = dt_util.utcnow().timestamp()
+            runtime = {}
+            for actuator, entity_id in (
+                (ACTUATOR_HEAT, self.heater_entity_id),
+                (ACTUATOR_COOL, self._cooler_entity_id),
+            ):
+                if entity_id:
+                    on_time, cycles = self._runtime_stats[actuator].window(
+                        now, WINDOW_24H
+                    )
+                    runtime[actuator] = {
+                        "duty_cycle": round(on_time / WINDOW_24H * 100, 1),
+                        "cycles_per_hour": round(cycles / 24, 2),
+                    }
+            attributes[ATTR_RUNTIME_24H] = runtime
+        return attributes
+
     @property
     def hvac_mode(self):
         """Return current operation."""
@@ -385,23 +1017,26 @@ class GenericClimate(ClimateEntity, RestoreEntity):
     async def async_set_hvac_mode(self, hvac_mode):
         """Set hvac mode."""
         hvac_mode = HVACMode(hvac_mode)
+        # Choosing a mode overrides an open window hold.
+        self._async_end_window_hold()
         if hvac_mode == HVACMode.HEAT:
             self._hvac_mode = HVACMode.HEAT
-            await self._async_control_heating(force=True)
+            await self._async_control_heating_cooling(force=True)
         elif hvac_mode == HVACMode.COOL:
             self._hvac_mode = HVACMode.COOL
-            await self._async_control_cooling(force=True)
+            await self._async_control_heating_cooling(force=True)
         elif hvac_mode == HVACMode.OFF:
             self._hvac_mode = HVACMode.OFF
-            if self._is_device_active:
-                await self._async_heater_turn_off()
-                if self._cooler_entity_id:
-                    await self._async_cooler_turn_off()
+            # Also when the switches look off: this replaces any turn_on
+            # still waiting for confirmation, which would otherwise be resent.
+            await self._async_heater_turn_off()
+            if self._cooler_entity_id:
+                await self._async_cooler_turn_off()
         else:
             _LOGGER.error("Unrecognized hvac mode: %s", hvac_mode)
             return
         # Ensure we update the current operation after changing the mode
-        self.async_write_ha_state()
+        self._async_write_state()
 
     async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
@@ -410,7 +1045,7 @@ class GenericClimate(ClimateEntity, RestoreEntity):
             return
         self._target_temp = temperature
         await self._async_control_heating_cooling(force=True)
-        self.async_write_ha_state()
+        self._async_write_state()
 
     @property
     def min_temp(self):
@@ -436,15 +1071,236 @@ class GenericClimate(ClimateEntity, RestoreEntity):
         if new_state is None or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
             return
 
+        if self._metrics is not None and self._decision_pending_since is None:
+            self._decision_pending_since = new_state.last_updated
         self._async_update_temp(new_state)
+        if self._sensor_debounce:
+            # Coalesce bursts: the latest reading wins and a single control
+            # pass runs once the window closes.
+            if self._sensor_debounce_unsub is not None:
+                self._coalesced_sensor_events += 1
+                return
+            self._sensor_debounce_unsub = async_call_later(
+                self.hass, self._sensor_debounce, self._async_sensor_debounced
+            )
+            return
+
         await self._async_control_heating_cooling(force=True)
-        self.async_write_ha_state()
+        self._async_write_state()
 
-    async def _async_control_heating_cooling(self, force = False):
-        if self._hvac_mode == HVACMode.COOL:
-            await self._async_control_cooling(force= force)
+    async def _async_sensor_reported(self, event):
+        """Re-arm the watchdog for a sensor repeating its last reading."""
+        new_state = event.data["new_state"]
+        try:
+            float(new_state.state)
+        except ValueError:
+            return
+        stale = self._sensor_stale
+        self._temp_updated = new_state.last_reported
+        self._async_arm_watchdog(new_state.last_reported)
+        if stale and not self._sensor_stale:
+            # Control from the temperature again rather than the failsafe.
+            await self._async_control_heating_cooling(force=True)
+            self._async_write_state()
+
+    async def _async_sensor_debounced(self, _now):
+        """Run the control loop once for a coalesced burst of sensor updates."""
+        self._sensor_debounce_unsub = None
+        await self._async_control_heating_cooling(force=True)
+        self._async_write_state()
+
+    async def _async_control_heating_cooling(self, time=None, force=False):
+        """Run a control pass through the zone's latest-intent worker."""
+        await self._control_worker.async_request(time=time, force=force)
+
+    async def _async_run_control(self, time, force):
+        """Run one control pass for the current HVAC mode."""
+        if self._sensor_stale:
+            await self._async_control_failsafe()
+        elif self._window_open:
+            await self._async_control_open_window()
+        elif self._hvac_mode == HVACMode.COOL:
+            await self._async_control_cooling(time=time, force=force)
         else:
-            await self._async_control_heating(force= force)
+            await self._async_control_heating(time=time, force=force)
+
+    @callback
+    def _async_arm_watchdog(self, reported):
+        """(Re-)arm the sensor watchdog for a reading taken at `reported`."""
+        scheduler = self._coordinator.scheduler
+        if not self._sensor_max_age:
+            scheduler.async_cancel((self, CONF_SENSOR_MAX_AGE))
+            self._async_leave_failsafe()
+            return
+        delay = (reported + self._sensor_max_age - dt_util.utcnow()).total_seconds()
+        if delay > 0:
+            self._async_leave_failsafe()
+        scheduler.async_schedule(
+            (self, CONF_SENSOR_MAX_AGE), max(delay, 0), self._async_sensor_timed_out
+        )
+
+    @callback
+    def _async_sensor_timed_out(self, now):
+        """Fall back to the failsafe when the sensors went quiet."""
+        if self._sensor_stale:
+            return
+        _LOGGER.warning(
+            "%s: no reading from %s for %s, switching to failsafe",
+            self.entity_id,
+            ", ".join(self.sensor_entity_ids),
+            self._sensor_max_age,
+        )
+        self._sensor_stale = True
+        self.hass.async_create_task(self._async_failsafe_tick(now))
+
+    @callback
+    def _async_leave_failsafe(self):
+        """Resume normal control after a fresh reading."""
+        if not self._sensor_stale:
+            return
+        _LOGGER.info("%s: sensor reports again, leaving failsafe", self.entity_id)
+        self._sensor_stale = False
+        self._coordinator.scheduler.async_cancel((self, CONF_FAILSAFE_DUTY_CYCLE))
+
+    async def _async_failsafe_tick(self, now):
+        """Run a failsafe control pass and publish the state."""
+        await self._async_control_heating_cooling(force=True)
+        self._async_write_state()
+
+    async def _async_control_failsafe(self):
+        """Drive the actuator of the current mode without a temperature.
+
+        The actuator is kept off, or run for `failsafe_duty_cycle` percent of
+        every failsafe cycle.
+        """
+        async with self._temp_lock:
+            if self._hvac_mode == HVACMode.HEAT:
+                entity_id = self.heater_entity_id
+            elif self._hvac_mode == HVACMode.COOL:
+                entity_id = self._cooler_entity_id
+            else:
+                self._async_record_outcome(OUTCOME_INACTIVE)
+                return
+            on_for = FAILSAFE_CYCLE * (self._failsafe_duty_cycle or 0) / 100
+            # Each zone runs its cycle at its own phase, as keep-alive ticks
+            # do, so stale zones on one plant do not all switch together.
+            phase = zlib.crc32(self.entity_id.encode()) / 0x100000000 * FAILSAFE_CYCLE
+            position = (dt_util.utcnow().timestamp() - phase) % FAILSAFE_CYCLE
+            run = position < on_for
+            self._async_record_outcome(
+                OUTCOME_FAILSAFE, SERVICE_TURN_ON if run else SERVICE_TURN_OFF
+            )
+            if 0 < on_for < FAILSAFE_CYCLE:
+                self._coordinator.scheduler.async_schedule(
+                    (self, CONF_FAILSAFE_DUTY_CYCLE),
+                    on_for - position if run else FAILSAFE_CYCLE - position,
+                    self._async_failsafe_tick,
+                )
+            await self._async_switch(
+                entity_id, SERVICE_TURN_ON if run else SERVICE_TURN_OFF
+            )
+
+    @callback
+    def _async_check_window(self, timestamp, temperature):
+        """Feed a reading to the slope estimate and hold on a steep drop.
+
+        While heating, a temperature falling at `open_window_drop` degrees
+        per minute or faster means a window is open; while cooling, one
+        rising as fast does.
+        """
+        newest = self._temp_slope.newest
+        if newest is not None and timestamp - newest < OPEN_WINDOW_SPACING:
+            return
+        self._temp_slope.add(timestamp, temperature)
+        if self._window_open or self._hvac_mode not in (HVACMode.HEAT, HVACMode.COOL):
+            return
+        slope = self._temp_slope.slope
+        if slope is None or self._temp_slope.span < OPEN_WINDOW_MIN_SPAN:
+            return
+        rate = slope * 60 if self._hvac_mode == HVACMode.COOL else -slope * 60
+        if rate < self._open_window_drop:
+            return
+        _LOGGER.info(
+            "%s: temperature changing %.2f per minute, holding for %s",
+            self.entity_id,
+            slope * 60,
+            self._open_window_hold,
+        )
+        self._window_open = True
+        self._coordinator.scheduler.async_schedule(
+            (self, CONF_OPEN_WINDOW_HOLD),
+            self._open_window_hold.total_seconds(),
+            self._async_window_hold_over,
+        )
+
+    @callback
+    def _async_end_window_hold(self):
+        """Drop an open window hold and start a fresh slope estimate."""
+        self._coordinator.scheduler.async_cancel((self, CONF_OPEN_WINDOW_HOLD))
+        # Readings from before or during the hold say nothing about now.
+        self._temp_slope.reset()
+        self._window_open = False
+
+    async def _async_window_hold_over(self, now):
+        """Resume control once the open window hold has run out."""
+        _LOGGER.info("%s: open window hold over, resuming", self.entity_id)
+        self._async_end_window_hold()
+        await self._async_control_heating_cooling(force=True)
+        self._async_write_state()
+
+    async def _async_control_open_window(self):
+        """Keep the actuator of the current mode off while a window is open."""
+        async with self._temp_lock:
+            if self._hvac_mode == HVACMode.HEAT:
+                entity_id = self.heater_entity_id
+            elif self._hvac_mode == HVACMode.COOL:
+                entity_id = self._cooler_entity_id
+            else:
+                self._async_record_outcome(OUTCOME_INACTIVE)
+                return
+            self._async_record_outcome(OUTCOME_OPEN_WINDOW, SERVICE_TURN_OFF)
+            await self._async_switch(entity_id, SERVICE_TURN_OFF)
+
+    @callback
+    def _async_apply_schedule(self):
+        """Take the scheduled setpoint and arm the timer for the next one.
+
+        Returns True if the target temperature changed.
+        """
+        if self._schedule is None:
+            self._coordinator.scheduler.async_cancel((self, CONF_SCHEDULE))
+            return False
+        now = dt_util.now()
+        setpoint = self._schedule.setpoint(now)
+        next_time, _ = self._schedule.next_transition(now)
+        self._coordinator.scheduler.async_schedule(
+            (self, CONF_SCHEDULE),
+            # Aware datetimes sharing a tzinfo subtract as wall-clock times,
+            # which is off by an hour across a DST change.
+            next_time.timestamp() - now.timestamp(),
+            self._async_schedule_transition,
+        )
+        if self._is_away:
+            # Comes back into effect when away mode ends.
+            self._saved_target_temp = setpoint
+            return False
+        if setpoint == self._target_temp:
+            return False
+        self._target_temp = setpoint
+        return True
+
+    async def _async_schedule_transition(self, now):
+        """Move the setpoint at a scheduled transition."""
+        if self._async_apply_schedule():
+            _LOGGER.info(
+                "%s: scheduled setpoint %s", self.entity_id, self._target_temp
+            )
+            await self._async_control_heating_cooling(force=True)
+            self._async_write_state()
+
+    async def _async_keep_alive(self, now):
+        """Re-send the current actuator state on a keep-alive tick."""
+        await self._async_control_heating_cooling(time=now)
 
     async def _async_humidity_sensor_changed(self, event):
         """Handle humidity changes."""
@@ -453,23 +1309,239 @@ class GenericClimate(ClimateEntity, RestoreEntity):
             return
 
         self._async_update_humidity(new_state)
-        self.async_write_ha_state()
+        self._async_write_state()
 
     @callback
     def _async_switch_changed(self, event):
-        """Handle heater switch state changes."""
+        """Handle heater and cooler switch state changes."""
         new_state = event.data.get("new_state")
+        self._async_update_device_state(event.data.get("entity_id"), new_state)
         if new_state is None:
             return
+        self._async_write_state()
+
+    @callback
+    def _async_update_device_state(self, entity_id, state):
+        """Update the cached on/off state of the heater or cooler."""
+        is_on = state is not None and state.state == STATE_ON
+        changed = state.last_changed if state is not None else dt_util.utcnow()
+        if entity_id == self.heater_entity_id and (
+            is_on != self._heater_on or self._heater_last_changed is None
+        ):
+            self._heater_on = is_on
+            self._heater_last_changed = changed
+            self._runtime_stats[ACTUATOR_HEAT].transition(is_on, changed.timestamp())
+            self._plant.async_set_calling(self, is_on)
+        if entity_id == self._cooler_entity_id and (
+            is_on != self._cooler_on or self._cooler_last_changed is None
+        ):
+            self._cooler_on = is_on
+            self._cooler_last_changed = changed
+            self._runtime_stats[ACTUATOR_COOL].transition(is_on, changed.timestamp())
+        if (command := self._commands.get(entity_id)) is not None and is_on == (
+            command[0] == SERVICE_TURN_ON
+        ):
+            self._async_command_confirmed(entity_id)
+        self._device_active = self._heater_on or self._cooler_on
+        if self._thermal_model is not None:
+            self._async_update_prediction()
+
+    @callback
+    def _async_warm_start(self, data):
+        """Resume from the temperature and switch states saved at shutdown.
+
+        Only applies while no sensor has reported yet and the saved reading
+        is younger than the warm_start bound. Returns True if the zone can be
+        controlled right away.
+        """
+        if not self._warm_start or self._cur_temp is not None:
+            return False
+        updated = dt_util.parse_datetime(data.get(RESTORE_TEMPERATURE_UPDATED) or "")
+        if (
+            updated is None
+            or data.get(RESTORE_CURRENT_TEMPERATURE) is None
+            or dt_util.utcnow() - updated > self._warm_start
+        ):
+            return False
+        self._cur_temp = float(data[RESTORE_CURRENT_TEMPERATURE])
+        self._temp_updated = updated
+        self._temp_restored = True
+        # Switches that have not reported yet are assumed to be as they were.
+        now = dt_util.utcnow()
+        for entity_id, key, actuator in (
+            (self.heater_entity_id, RESTORE_HEATER_ON, ACTUATOR_HEAT),
+            (self._cooler_entity_id, RESTORE_COOLER_ON, ACTUATOR_COOL),
+        ):
+            state = self.hass.states.get(entity_id) if entity_id else None
+            if not data.get(key) or (
+                state is not None
+                and state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN)
+            ):
+                continue
+            if actuator == ACTUATOR_HEAT:
+                self._heater_on = True
+                self._plant.async_set_calling(self, True)
+            else:
+                self._cooler_on = True
+            self._runtime_stats[actuator].transition(True, now.timestamp())
+        self._device_active = self._heater_on or self._cooler_on
+        self._coordinator.scheduler.async_schedule(
+            (self, CONF_WARM_START),
+            (updated + self._warm_start - now).total_seconds(),
+            self._async_warm_start_expired,
+        )
+        _LOGGER.info(
+            "%s: resuming from restored temperature %s", self.entity_id, self._cur_temp
+        )
+        return True
+
+    @callback
+    def _async_warm_start_expired(self, now):
+        """Forget the restored temperature if no sensor replaced it in time."""
+        if not self._temp_restored:
+            return
+        _LOGGER.warning(
+            "%s: no sensor reading within %s of the restored one",
+            self.entity_id,
+            self._warm_start,
+        )
+        self._temp_restored = False
+        self._cur_temp = None
+        self._async_write_state()
+
+    @callback
+    def _async_restore_transitions(self, data):
+        """Restore actuator transition times if the actuator kept its state."""
+        heater_last_changed = dt_util.parse_datetime(
+            data.get(RESTORE_HEATER_LAST_CHANGED) or ""
+        )
+        if heater_last_changed and data.get(RESTORE_HEATER_ON) == self._heater_on:
+            self._heater_last_changed = heater_last_changed
+        cooler_last_changed = dt_util.parse_datetime(
+            data.get(RESTORE_COOLER_LAST_CHANGED) or ""
+        )
+        if cooler_last_changed and data.get(RESTORE_COOLER_ON) == self._cooler_on:
+            self._cooler_last_changed = cooler_last_changed
+        if self._thermal_model is not None and data.get(RESTORE_THERMAL_MODEL):
+            self._thermal_model.restore(data[RESTORE_THERMAL_MODEL])
+        for actuator, stats in (data.get(RESTORE_RUNTIME_STATS) or {}).items():
+            if actuator in self._runtime_stats and stats:
+                self._runtime_stats[actuator].restore(stats)
+
+    @property
+    def extra_restore_state_data(self):
+        """Return actuator transition times and statistics to persist."""
+        now = dt_util.utcnow().timestamp()
+        return RestoredExtraData(
+            {
+                RESTORE_HEATER_ON: self._heater_on,
+                RESTORE_HEATER_LAST_CHANGED: (
+                    self._heater_last_changed.isoformat()
+                    if self._heater_last_changed
+                    else None
+                ),
+                RESTORE_COOLER_ON: self._cooler_on,
+                RESTORE_COOLER_LAST_CHANGED: (
+                    self._cooler_last_changed.isoformat()
+                    if self._cooler_last_changed
+                    else None
+                ),
+                RESTORE_THERMAL_MODEL: (
+                    self._thermal_model.as_dict() if self._thermal_model else None
+                ),
+                RESTORE_CURRENT_TEMPERATURE: self._cur_temp,
+                RESTORE_TEMPERATURE_UPDATED: (
+                    self._temp_updated.isoformat() if self._temp_updated else None
+                ),
+                RESTORE_RUNTIME_STATS: {
+                    actuator: stats.as_dict(now)
+                    for actuator, stats in self._runtime_stats.items()
+                },
+            }
+        )
+
+    @callback
+    def _async_write_state(self):
+        """Write the state unless no exposed value changed significantly.
+
+        The current temperature and humidity count as changed once they moved
+        by at least their configured delta, everything else on any change.
+        Attributes that are only diagnostic, such as the coalesced sensor
+        event count, go out with the next significant write.
+        """
+        snapshot = (
+            self._hvac_mode,
+            self.hvac_action,
+            self.preset_mode,
+            self._target_temp,
+            self._min_temp,
+            self._max_temp,
+            self._temp_precision,
+            self._support_flags,
+            tuple(self._hvac_list),
+            self._name,
+            self._degraded,
+            self._sensor_stale,
+            self._window_open,
+        )
+        written = self._written_state
+        if (
+            written is not None
+            and written[0] == snapshot
+            and not _moved(written[1], self._cur_temp, self._state_temperature_delta)
+            and not _moved(written[2], self._cur_hum, self._state_humidity_delta)
+        ):
+            self._suppressed_writes += 1
+            return
+        self._written_state = (snapshot, self._cur_temp, self._cur_hum)
         self.async_write_ha_state()
 
+    def _cycle_long_enough(self, last_changed):
+        """Return True if the actuator has kept its state for min_cycle_duration."""
+        return (
+            last_changed is None
+            or dt_util.utcnow() - last_changed >= self.min_cycle_duration
+        )
+
     @callback
     def _async_update_temp(self, state):
         """Update thermostat with latest state from sensor."""
         try:
-            self._cur_temp = float(state.state)
+            value = float(state.state)
         except ValueError as ex:
-            _LOGGER.error("Unable to update from sensor: %s", ex)
+            self._async_log_parse_error(state.entity_id, ex)
+            return
+        timestamp = state.last_updated.timestamp()
+        self._sensor_aggregator.add(state.entity_id, value, timestamp)
+        cur_temp = self._sensor_aggregator.value(dt_util.utcnow().timestamp())
+        if cur_temp is None:
+            return
+        self._cur_temp = cur_temp
+        self._temp_updated = state.last_updated
+        self._temp_restored = False
+        if self._sensor_max_age:
+            self._async_arm_watchdog(state.last_updated)
+        if self._open_window_drop:
+            self._async_check_window(timestamp, cur_temp)
+        if self._thermal_model is not None:
+            self._thermal_model.add_sample(timestamp, cur_temp, self._actuator)
+            self._async_update_prediction()
+
+    @property
+    def _actuator(self):
+        """Return which actuator is currently running."""
+        if self._heater_on:
+            return ACTUATOR_HEAT
+        if self._cooler_on:
+            return ACTUATOR_COOL
+        return ACTUATOR_OFF
+
+    @callback
+    def _async_update_prediction(self):
+        """Project the temperature over the predictive horizon."""
+        self._predicted_delta = self._thermal_model.predict_delta(
+            self._actuator, self._predictive_horizon.total_seconds()
+        )
 
     @callback
     def _async_update_humidity(self, state):
@@ -477,7 +1549,26 @@ class GenericClimate(ClimateEntity, RestoreEntity):
         try:
             self._cur_hum = float(state.state)
         except ValueError as ex:
-            _LOGGER.error("Unable to update from sensor: %s", ex)
+            self._async_log_parse_error(state.entity_id, ex)
+
+    @callback
+    def _async_log_parse_error(self, entity_id, ex):
+        """Log an unparsable sensor state, at most once per interval per sensor."""
+        now = monotonic()
+        last_logged, suppressed = self._parse_errors.get(entity_id, (None, 0))
+        if last_logged is not None and now - last_logged < PARSE_ERROR_LOG_INTERVAL:
+            self._parse_errors[entity_id] = (last_logged, suppressed + 1)
+            return
+        if suppressed:
+            _LOGGER.error(
+                "Unable to update from sensor %s: %s (%d similar errors suppressed)",
+                entity_id,
+                ex,
+                suppressed,
+            )
+        else:
+            _LOGGER.error("Unable to update from sensor %s: %s", entity_id, ex)
+        self._parse_errors[entity_id] = (now, 0)
 
     async def _async_control_heating(self, time=None, force=False):
         """Check if we need to turn heating on or off."""
@@ -491,12 +1582,15 @@ class GenericClimate(ClimateEntity, RestoreEntity):
                     self._target_temp,
                 )
 
-            if not self._active or self._hvac_mode == HVACMode.OFF:
+            hvac_mode = self._hvac_mode
+            if not self._active or hvac_mode == HVACMode.OFF:
+                self._async_record_outcome(OUTCOME_INACTIVE)
                 return
 
             cur_temp = self._cur_temp
             target_temp = self._target_temp
             if cur_temp is None or target_temp is None:
+                self._async_record_outcome(OUTCOME_INACTIVE)
                 return
 
             if not force and time is None:
@@ -505,43 +1599,44 @@ class GenericClimate(ClimateEntity, RestoreEntity):
                 # If the `time` argument is not none, we were invoked for
                 # keep-alive purposes, and `min_cycle_duration` is irrelevant.
                 if self.min_cycle_duration:
-                    if self._is_device_active:
-                        current_state = STATE_ON
-                    else:
-                        current_state = HVACMode.OFF
-                    long_enough = condition.state(
-                        self.hass,
-                        self.heater_entity_id,
-                        current_state,
-                        self.min_cycle_duration,
-                    )
-                    if not long_enough:
+                    if not self._cycle_long_enough(self._heater_last_changed):
+                        self._async_record_outcome(OUTCOME_MIN_CYCLE)
                         return
 
-            too_cold = target_temp >= cur_temp + self._cold_tolerance
-            too_hot = cur_temp >= target_temp + self._hot_tolerance
-            if self._is_device_active:
-                if too_hot:
-                    _LOGGER.info("Turning off heater %s",
-                                 self.heater_entity_id)
-                    await self._async_heater_turn_off()
-                elif time is not None:
-                    # The time argument is passed only in keep-alive case
+            decision = await self._async_evaluate()
+            if self._hvac_mode != hvac_mode:
+                # The mode changed while the coordinator decided; that change
+                # already switched the actuators.
+                self._async_record_outcome(OUTCOME_INACTIVE)
+                return
+            if decision == DECISION_TURN_OFF:
+                self._async_record_outcome(OUTCOME_TURN_OFF, SERVICE_TURN_OFF)
+                _LOGGER.info("Turning off heater %s",
+                             self.heater_entity_id)
+                await self._async_heater_turn_off()
+            elif decision == DECISION_TURN_ON:
+                self._async_record_outcome(OUTCOME_TURN_ON, SERVICE_TURN_ON)
+                _LOGGER.info("Turning on heater %s", self.heater_entity_id)
+                await self._async_heater_turn_on()
+            elif time is not None:
+                # The time argument is passed only in keep-alive case
+                self._async_record_outcome(
+                    OUTCOME_KEEP_ALIVE,
+                    SERVICE_TURN_ON if self._is_device_active else SERVICE_TURN_OFF,
+                )
+                if self._is_device_active:
                     _LOGGER.info(
                         "Keep-alive - Turning on heater heater %s",
                         self.heater_entity_id,
                     )
                     await self._async_heater_turn_on()
-            else:
-                if too_cold:
-                    _LOGGER.info("Turning on heater %s", self.heater_entity_id)
-                    await self._async_heater_turn_on()
-                elif time is not None:
-                    # The time argument is passed only in keep-alive case
+                else:
                     _LOGGER.info(
                         "Keep-alive - Turning off heater %s", self.heater_entity_id
                     )
                     await self._async_heater_turn_off()
+            else:
+                self._async_record_outcome(OUTCOME_HOLD)
 
     async def _async_control_cooling(self, time=None, force=False):
         """Check if we need to turn cooling on or off."""
@@ -555,12 +1650,15 @@ class GenericClimate(ClimateEntity, RestoreEntity):
                     self._target_temp,
                 )
 
-            if not self._active or self._hvac_mode == HVACMode.OFF:
+            hvac_mode = self._hvac_mode
+            if not self._active or hvac_mode == HVACMode.OFF:
+                self._async_record_outcome(OUTCOME_INACTIVE)
                 return
 
             cur_temp = self._cur_temp
             target_temp = self._target_temp
             if cur_temp is None or target_temp is None:
+                self._async_record_outcome(OUTCOME_INACTIVE)
                 return
 
             if not force and time is None:
@@ -569,80 +1667,225 @@ class GenericClimate(ClimateEntity, RestoreEntity):
                 # If the `time` argument is not none, we were invoked for
                 # keep-alive purposes, and `min_cycle_duration` is irrelevant.
                 if self.min_cycle_duration:
-                    if self._is_device_active:
-                        current_state = STATE_ON
-                    else:
-                        current_state = HVACMode.OFF
-                    long_enough = condition.state(
-                        self.hass,
-                        self._cooler_entity_id,
-                        current_state,
-                        self.min_cycle_duration,
-                    )
-                    if not long_enough:
+                    if not self._cycle_long_enough(self._cooler_last_changed):
+                        self._async_record_outcome(OUTCOME_MIN_CYCLE)
                         return
 
-            too_cold = target_temp >= cur_temp + self._cold_tolerance
-            too_hot = cur_temp >= target_temp + self._hot_tolerance
-            if self._is_device_active:
-                if too_cold:
-                    _LOGGER.info("Turning off cooler %s", self._cooler_entity_id)
-                    await self._async_cooler_turn_off()
-                elif time is not None:
-                    # The time argument is passed only in keep-alive case
+            decision = await self._async_evaluate()
+            if self._hvac_mode != hvac_mode:
+                # The mode changed while the coordinator decided; that change
+                # already switched the actuators.
+                self._async_record_outcome(OUTCOME_INACTIVE)
+                return
+            if decision == DECISION_TURN_OFF:
+                self._async_record_outcome(OUTCOME_TURN_OFF, SERVICE_TURN_OFF)
+                _LOGGER.info("Turning off cooler %s", self._cooler_entity_id)
+                await self._async_cooler_turn_off()
+            elif decision == DECISION_TURN_ON:
+                self._async_record_outcome(OUTCOME_TURN_ON, SERVICE_TURN_ON)
+                _LOGGER.info("Turning on cooler %s", self._cooler_entity_id)
+                await self._async_cooler_turn_on()
+            elif time is not None:
+                # The time argument is passed only in keep-alive case
+                self._async_record_outcome(
+                    OUTCOME_KEEP_ALIVE,
+                    SERVICE_TURN_ON if self._is_device_active else SERVICE_TURN_OFF,
+                )
+                if self._is_device_active:
                     _LOGGER.info(
                         "Keep-alive - Turning on cooler %s",
                         self._cooler_entity_id,
                     )
                     await self._async_cooler_turn_on()
-            else:
-                if too_hot:
-                    _LOGGER.info("Turning on cooler %s", self._cooler_entity_id)
-                    await self._async_cooler_turn_on()
-                elif time is not None:
-                    # The time argument is passed only in keep-alive case
+                else:
                     _LOGGER.info(
                         "Keep-alive - Turning off cooler %s", self._cooler_entity_id
                     )
                     await self._async_cooler_turn_off()
+            else:
+                self._async_record_outcome(OUTCOME_HOLD)
+
+    @callback
+    def _async_record_outcome(self, outcome, service=None):
+        """Trace a control decision; count it and its latency if instrumented."""
+        if self._trace is not None:
+            self._trace.record(
+                dt_util.utcnow().timestamp(),
+                self._cur_temp,
+                self._target_temp,
+                self._hvac_mode,
+                outcome,
+                service,
+            )
+        if self._metrics is None:
+            return
+        self._metrics.outcomes[outcome] += 1
+        if self._decision_pending_since is not None:
+            self._metrics.event_to_decision.observe(
+                (dt_util.utcnow() - self._decision_pending_since).total_seconds()
+            )
+            self._decision_pending_since = None
+
+    async def _async_evaluate(self):
+        """Let the coordinator decide this zone in its next batched pass."""
+        return await self._coordinator.async_evaluate(self._zone)
 
     @property
     def _is_device_active(self):
-        """If the toggleable device is currently active."""
-        return self.hass.states.is_state(self.heater_entity_id, STATE_ON) or (self._cooler_entity_id and self.hass.states.is_state(self._cooler_entity_id, STATE_ON))
+        """If the toggleable device is currently active.
+
+        Kept up to date from the heater and cooler state change events.
+        """
+        return self._heater_on or self._cooler_on
+
+    @property
+    def metrics(self):
+        """Return the control path metrics, if instrumentation is enabled."""
+        return self._metrics
+
+    @property
+    def runtime_stats(self):
+        """Return the rolling runtime statistics per actuator."""
+        return self._runtime_stats
+
+    async def async_dump_decision_trace(self):
+        """Return the recorded control decisions, oldest first."""
+        if self._trace is None:
+            return {"decisions": [], "recorded": 0}
+        return {"decisions": self._trace.records(), "recorded": self._trace.count}
+
+    def diagnostics(self):
+        """Return the zone's runtime state for a diagnostics download."""
+        return {
+            "entity_id": self.entity_id,
+            "hvac_mode": self._hvac_mode,
+            "current_temperature": self._cur_temp,
+            "target_temperature": self._target_temp,
+            "heater_on": self._heater_on,
+            "cooler_on": self._cooler_on,
+            "degraded": self._degraded,
+            "sensor_stale": self._sensor_stale,
+            "window_open": self._window_open,
+            "schedule": self._schedule.as_dict() if self._schedule else None,
+            "decision_trace": self._trace.records() if self._trace else None,
+            "plant": self._plant.as_dict(),
+            "suppressed_writes": self._suppressed_writes,
+            "runtime": {
+                actuator: stats.summary(dt_util.utcnow().timestamp())
+                for actuator, stats in self._runtime_stats.items()
+            },
+            "unconfirmed_commands": {
+                entity_id: {"service": service, "retries": retries}
+                for entity_id, (service, retries) in self._commands.items()
+            },
+            "metrics": self._metrics.as_dict() if self._metrics else None,
+        }
 
     @property
     def supported_features(self):
         """Return the list of supported features."""
         return self._support_flags
 
+    async def _async_switch(self, entity_id, service):
+        """Send a turn_on/turn_off command to one of the actuators.
+
+        The command is sent in the background. It counts as delivered once
+        the switch reports the requested state; until then it is resent with
+        exponential backoff, and the entity is marked degraded when all
+        retries are used up.
+        """
+        if (command := self._commands.get(entity_id)) is not None and command[
+            0
+        ] == service:
+            # Already in flight; the confirmation timer resends it if needed.
+            return
+        is_on = (
+            self._heater_on if entity_id == self.heater_entity_id else self._cooler_on
+        )
+        if is_on == (service == SERVICE_TURN_ON):
+            # Nothing to confirm, but an opposite command may still be in flight.
+            self._async_command_confirmed(entity_id)
+        else:
+            self._commands[entity_id] = [service, 0]
+            self._async_schedule_confirmation(entity_id, 0)
+        self.hass.async_create_task(self._async_send_command(entity_id, service))
+
+    async def _async_send_command(self, entity_id, service):
+        """Issue a command through the coordinator's dispatcher."""
+        start = perf_counter()
+        try:
+            await self._coordinator.dispatcher.async_command(
+                entity_id, service, self._context
+            )
+        except HomeAssistantError as err:
+            # The confirmation timer retries it.
+            _LOGGER.warning("Unable to %s %s: %s", service, entity_id, err)
+            return
+        if self._metrics is not None:
+            self._metrics.service_call.observe(perf_counter() - start)
+
+    @callback
+    def _async_schedule_confirmation(self, entity_id, retries):
+        """Arm the deadline by which entity_id must report the commanded state."""
+        self._coordinator.scheduler.async_schedule(
+            (self, "confirm", entity_id),
+            COMMAND_TIMEOUT * 2**retries,
+            partial(self._async_command_timeout, entity_id),
+        )
+
+    @callback
+    def _async_command_confirmed(self, entity_id):
+        """Stop waiting for entity_id to report a commanded state."""
+        if self._commands.pop(entity_id, None) is None:
+            return
+        self._coordinator.scheduler.async_cancel((self, "confirm", entity_id))
+        if self._degraded and not self._commands:
+            _LOGGER.info("%s: actuators respond again", self.entity_id)
+            self._degraded = False
+
+    @callback
+    def _async_command_timeout(self, entity_id, now):
+        """Resend an unconfirmed command, or give up on it."""
+        if (command := self._commands.get(entity_id)) is None:
+            return
+        service, retries = command
+        if service == SERVICE_TURN_ON and self._hvac_mode == HVACMode.OFF:
+            # Switched off since it was sent; never turn an actuator back on.
+            self._async_command_confirmed(entity_id)
+            return
+        if retries >= COMMAND_RETRIES:
+            del self._commands[entity_id]
+            if not self._degraded:
+                _LOGGER.warning(
+                    "%s: %s did not confirm %s after %s retries",
+                    self.entity_id,
+                    entity_id,
+                    service,
+                    retries,
+                )
+                self._degraded = True
+                self._async_write_state()
+            return
+        command[1] = retries + 1
+        _LOGGER.debug("%s: resending %s to %s", self.entity_id, service, entity_id)
+        self._async_schedule_confirmation(entity_id, retries + 1)
+        self.hass.async_create_task(self._async_send_command(entity_id, service))
+
     async def _async_heater_turn_on(self):
         """Turn heater toggleable device on."""
-        data = {ATTR_ENTITY_ID: self.heater_entity_id}
-        await self.hass.services.async_call(
-            HA_DOMAIN, SERVICE_TURN_ON, data, context=self._context
-        )
+        await self._async_switch(self.heater_entity_id, SERVICE_TURN_ON)
 
     async def _async_heater_turn_off(self):
         """Turn heater toggleable device off."""
-        data = {ATTR_ENTITY_ID: self.heater_entity_id}
-        await self.hass.services.async_call(
-            HA_DOMAIN, SERVICE_TURN_OFF, data, context=self._context
-        )
+        await self._async_switch(self.heater_entity_id, SERVICE_TURN_OFF)
 
     async def _async_cooler_turn_on(self):
         """Turn cooler toggleable device on."""
-        data = {ATTR_ENTITY_ID: self._cooler_entity_id}
-        await self.hass.services.async_call(
-            HA_DOMAIN, SERVICE_TURN_ON, data, context=self._context
-        )
+        await self._async_switch(self._cooler_entity_id, SERVICE_TURN_ON)
 
     async def _async_cooler_turn_off(self):
         """Turn cooler toggleable device off."""
-        data = {ATTR_ENTITY_ID: self._cooler_entity_id}
-        await self.hass.services.async_call(
-            HA_DOMAIN, SERVICE_TURN_OFF, data, context=self._context
-        )
+        await self._async_switch(self._cooler_entity_id, SERVICE_TURN_OFF)
 
     async def async_set_preset_mode(self, preset_mode: str):
         """Set new preset mode."""
@@ -656,4 +1899,4 @@ class GenericClimate(ClimateEntity, RestoreEntity):
            
         await self._async_control_heating_cooling(force=True)
 
-        self.async_write_ha_state()
+        self._async_write_state()
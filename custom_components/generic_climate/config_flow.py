@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import csv
+
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -12,28 +15,113 @@ from homeassistant.const import (
     PRECISION_TENTHS,
     PRECISION_WHOLE,
 )
+from homeassistant.core import callback
+from homeassistant.data_entry_flow import FlowResultType
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers import selector
+from homeassistant.helpers import entity_registry as er, selector
 
-from .climate import (
+from .aggregation import AGGREGATE_MEAN, AGGREGATES
+from .const import (
     CONF_AWAY_TEMP,
     CONF_COLD_TOLERANCE,
     CONF_COOLER,
+    CONF_DECISION_TRACE,
+    CONF_DEMAND_WEIGHT,
+    CONF_FAILSAFE_DUTY_CYCLE,
     CONF_HEATER,
     CONF_HOT_TOLERANCE,
     CONF_HUMIDITY_SENSOR,
     CONF_INITIAL_HVAC_MODE,
+    CONF_INSTRUMENTATION,
     CONF_KEEP_ALIVE,
     CONF_MAX_TEMP,
     CONF_MIN_DUR,
     CONF_MIN_TEMP,
+    CONF_OPEN_WINDOW_DROP,
+    CONF_OPEN_WINDOW_HOLD,
+    CONF_PLANT_MIN_CYCLE,
+    CONF_PLANT_SWITCH,
     CONF_PRECISION,
+    CONF_PREDICTIVE_HORIZON,
+    CONF_SCHEDULE,
+    CONF_SCHEDULE_PREHEAT,
     CONF_SENSOR,
+    CONF_SENSOR_AGGREGATE,
+    CONF_SENSOR_DEBOUNCE,
+    CONF_SENSOR_MAX_AGE,
+    CONF_SENSOR_OUTLIER_THRESHOLD,
+    CONF_SENSOR_STALE_AFTER,
+    CONF_SENSOR_WINDOW,
+    CONF_STATE_HUMIDITY_DELTA,
+    CONF_STATE_TEMPERATURE_DELTA,
     CONF_TARGET_TEMP,
+    CONF_WARM_START,
+    CONF_ZONES,
     DEFAULT_NAME,
     DEFAULT_TOLERANCE,
+    DEFAULT_TRACE_SIZE,
+    DOMAIN,
+    INITIAL_HVAC_MODES,
+    SCHEDULE_SCHEMA,
+    ZONE_SCHEMA,
+    storable,
+)
+
+# A bulk table row takes every zone option; these are the ones it needs.
+ZONE_ROW_SCHEMA = ZONE_SCHEMA.extend(
+    {
+        vol.Required(CONF_NAME): cv.string,
+        vol.Required(CONF_HEATER): cv.entity_id,
+        vol.Required(CONF_SENSOR): cv.entity_ids,
+    }
+)
+BULK_TABLE_HEADER = ",".join(
+    (CONF_NAME, CONF_UNIQUE_ID, CONF_HEATER, CONF_COOLER, CONF_SENSOR, CONF_HUMIDITY_SENSOR)
 )
-from . import DOMAIN
+
+
+def _parse_zone_table(text):
+    """Parse a CSV table of zones.
+
+    The first line names the columns: any zone option, with several target
+    sensors quoted and comma separated in one cell. Blank lines and lines
+    starting with `#` are skipped. Returns the header and two lists of
+    `(line, data)` for valid rows and `(line, error)` for the others.
+    """
+    lines = [
+        line
+        for line in text.splitlines()
+        if line.strip() and not line.lstrip().startswith("#")
+    ]
+    if not lines:
+        return "", [], []
+    header, *rows = lines
+    columns = [column.strip() for column in next(csv.reader([header]))]
+    valid, failed = [], []
+    for line in rows:
+        values = next(csv.reader([line]))
+        if len(values) > len(columns):
+            failed.append((line, "more cells than columns"))
+            continue
+        row = {
+            column: value.strip()
+            for column, value in zip(columns, values)
+            if value.strip()
+        }
+        try:
+            valid.append((line, storable(ZONE_ROW_SCHEMA(row))))
+        except vol.Invalid as err:
+            failed.append((line, str(err)))
+    return header, valid, failed
+
+
+def _referenced_entities(data):
+    """Return every entity id a zone's data points at."""
+    entity_ids = list(data[CONF_SENSOR])
+    for key in (CONF_HEATER, CONF_COOLER, CONF_HUMIDITY_SENSOR, CONF_PLANT_SWITCH):
+        if data.get(key):
+            entity_ids.append(data[key])
+    return entity_ids
 
 
 class GenericClimateConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -42,7 +130,115 @@ class GenericClimateConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
     async def async_step_user(self, user_input=None):
-        """Handle the initial step."""
+        """Let the user add one zone or a table of zones."""
+        return self.async_show_menu(step_id="user", menu_options=["zone", "bulk"])
+
+    async def async_step_import(self, import_data):
+        """Create the entry of one zone of a bulk table."""
+        if unique_id := import_data.get(CONF_UNIQUE_ID):
+            await self.async_set_unique_id(unique_id)
+            self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=import_data.get(CONF_NAME, DEFAULT_NAME),
+            data=import_data,
+        )
+
+    async def async_step_bulk(self, user_input=None):
+        """Create an entry for every valid row of a table of zones.
+
+        Rows that fail are not created; the form comes back holding just
+        those rows, each preceded by a comment with the reason, so they can
+        be fixed and submitted again.
+        """
+        errors: dict[str, str] = {}
+        table = BULK_TABLE_HEADER
+        placeholders = {"created": "0", "failed": "0"}
+
+        if user_input is not None:
+            header, valid, failed = _parse_zone_table(user_input[CONF_ZONES])
+            if not header:
+                errors["base"] = "empty_table"
+            else:
+                valid, rejected = self._async_check_rows(valid)
+                failed.extend(rejected)
+                results = await asyncio.gather(
+                    *(
+                        self.hass.config_entries.flow.async_init(
+                            DOMAIN,
+                            context={"source": config_entries.SOURCE_IMPORT},
+                            data=data,
+                        )
+                        for _, data in valid
+                    ),
+                    return_exceptions=True,
+                )
+                created = 0
+                for (line, _), result in zip(valid, results):
+                    if isinstance(result, BaseException):
+                        failed.append((line, f"not created: {result}"))
+                    elif result["type"] == FlowResultType.CREATE_ENTRY:
+                        created += 1
+                    else:
+                        reason = result.get("reason") or result["type"]
+                        failed.append((line, f"not created: {reason}"))
+                placeholders = {"created": str(created), "failed": str(len(failed))}
+                if not failed:
+                    return self.async_abort(
+                        reason="bulk_created", description_placeholders=placeholders
+                    )
+                errors["base"] = "invalid_rows"
+                table = "\n".join(
+                    [header, *(f"# {error}\n{line}" for line, error in failed)]
+                )
+
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_ZONES, default=table): selector.TextSelector(
+                    selector.TextSelectorConfig(multiline=True)
+                ),
+            }
+        )
+        return self.async_show_form(
+            step_id="bulk",
+            data_schema=schema,
+            errors=errors,
+            description_placeholders=placeholders,
+        )
+
+    @callback
+    def _async_check_rows(self, rows):
+        """Check the referenced entities and unique ids of all rows at once.
+
+        Every entity id used anywhere in the table is looked up once, in the
+        entity registry or, for entities without a unique id, the state
+        machine. Returns the accepted rows and `(line, error)` for the rest.
+        """
+        registry = er.async_get(self.hass)
+        referenced = {
+            entity_id for _, data in rows for entity_id in _referenced_entities(data)
+        }
+        missing = {
+            entity_id
+            for entity_id in referenced
+            if registry.async_get(entity_id) is None
+            and self.hass.states.get(entity_id) is None
+        }
+        unique_ids = set(self._async_current_ids())
+        accepted, rejected = [], []
+        for line, data in rows:
+            if unknown := sorted(set(_referenced_entities(data)) & missing):
+                rejected.append((line, f"unknown entities: {', '.join(unknown)}"))
+                continue
+            if unique_id := data.get(CONF_UNIQUE_ID):
+                if unique_id in unique_ids:
+                    rejected.append((line, f"unique_id {unique_id} is already used"))
+                    continue
+                unique_ids.add(unique_id)
+            accepted.append((line, data))
+        return accepted, rejected
+
+    async def async_step_zone(self, user_input=None):
+        """Handle the form for a single zone."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
@@ -51,7 +247,7 @@ class GenericClimateConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 self._abort_if_unique_id_configured()
             return self.async_create_entry(
                 title=user_input.get(CONF_NAME, DEFAULT_NAME),
-                data=user_input,
+                data=storable(user_input),
             )
 
         switch_selector = selector.EntitySelector(
@@ -60,13 +256,16 @@ class GenericClimateConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         sensor_selector = selector.EntitySelector(
             selector.EntitySelectorConfig(domain="sensor")
         )
+        target_sensor_selector = selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="sensor", multiple=True)
+        )
 
         schema = vol.Schema(
             {
                 vol.Optional(CONF_NAME, default=DEFAULT_NAME): cv.string,
                 vol.Optional(CONF_UNIQUE_ID): cv.string,
                 vol.Required(CONF_HEATER): switch_selector,
-                vol.Required(CONF_SENSOR): sensor_selector,
+                vol.Required(CONF_SENSOR): target_sensor_selector,
                 vol.Optional(CONF_COOLER): switch_selector,
                 vol.Optional(CONF_HUMIDITY_SENSOR): sensor_selector,
                 vol.Optional(CONF_MIN_TEMP): vol.Coerce(float),
@@ -81,16 +280,50 @@ class GenericClimateConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 ),
                 vol.Optional(CONF_MIN_DUR): cv.positive_time_period,
                 vol.Optional(CONF_KEEP_ALIVE): cv.positive_time_period,
-                vol.Optional(CONF_INITIAL_HVAC_MODE): vol.In(
-                    ["off", "heat", "cool"]
+                vol.Optional(CONF_SENSOR_DEBOUNCE): cv.positive_time_period,
+                vol.Optional(CONF_PREDICTIVE_HORIZON): cv.positive_time_period,
+                vol.Optional(CONF_INSTRUMENTATION, default=False): cv.boolean,
+                vol.Optional(CONF_SENSOR_AGGREGATE, default=AGGREGATE_MEAN): vol.In(
+                    AGGREGATES
+                ),
+                vol.Optional(CONF_SENSOR_WINDOW, default=1): cv.positive_int,
+                vol.Optional(CONF_SENSOR_OUTLIER_THRESHOLD): vol.Coerce(float),
+                vol.Optional(CONF_SENSOR_STALE_AFTER): cv.positive_time_period,
+                vol.Optional(CONF_STATE_TEMPERATURE_DELTA): vol.All(
+                    vol.Coerce(float), vol.Range(min=0)
                 ),
+                vol.Optional(CONF_STATE_HUMIDITY_DELTA): vol.All(
+                    vol.Coerce(float), vol.Range(min=0)
+                ),
+                vol.Optional(CONF_WARM_START): cv.positive_time_period,
+                vol.Optional(CONF_SENSOR_MAX_AGE): cv.positive_time_period,
+                vol.Optional(CONF_FAILSAFE_DUTY_CYCLE): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, max=100)
+                ),
+                vol.Optional(CONF_SCHEDULE): vol.All(
+                    selector.ObjectSelector(), SCHEDULE_SCHEMA
+                ),
+                vol.Optional(CONF_SCHEDULE_PREHEAT): cv.positive_time_period,
+                vol.Optional(
+                    CONF_DECISION_TRACE, default=DEFAULT_TRACE_SIZE
+                ): cv.positive_int,
+                vol.Optional(CONF_PLANT_SWITCH): switch_selector,
+                vol.Optional(CONF_PLANT_MIN_CYCLE): cv.positive_time_period,
+                vol.Optional(CONF_DEMAND_WEIGHT): vol.All(
+                    vol.Coerce(float), vol.Range(min=0)
+                ),
+                vol.Optional(CONF_OPEN_WINDOW_DROP): vol.All(
+                    vol.Coerce(float), vol.Range(min=0)
+                ),
+                vol.Optional(CONF_OPEN_WINDOW_HOLD): cv.positive_time_period,
+                vol.Optional(CONF_INITIAL_HVAC_MODE): vol.In(INITIAL_HVAC_MODES),
                 vol.Optional(CONF_PRECISION): vol.In(
                     [PRECISION_TENTHS, PRECISION_HALVES, PRECISION_WHOLE]
                 ),
             }
         )
 
-        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
+        return self.async_show_form(step_id="zone", data_schema=schema, errors=errors)
 
     @staticmethod
     def async_get_options_flow(config_entry):
@@ -110,10 +343,12 @@ class GenericClimateOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             # Normalize empty strings (if any) to None so async_setup_entry
             # doesn't receive invalid entity IDs.
-            normalized = {
-                key: (value if value not in ("", []) else None)
-                for key, value in user_input.items()
-            }
+            normalized = storable(
+                {
+                    key: (value if value not in ("", []) else None)
+                    for key, value in user_input.items()
+                }
+            )
 
             # If unique_id is changed via options, require explicit confirmation.
             # Note: changing unique_id may create a new entity registry entry.
@@ -125,6 +360,10 @@ class GenericClimateOptionsFlow(config_entries.OptionsFlow):
             return self.async_create_entry(title="", data=normalized)
 
         current = {**self._config_entry.data, **self._config_entry.options}
+        # Entries created before multi-sensor support hold a single entity id.
+        target_sensors = current.get(CONF_SENSOR)
+        if isinstance(target_sensors, str):
+            target_sensors = [target_sensors]
 
         switch_selector = selector.EntitySelector(
             selector.EntitySelectorConfig(domain="switch")
@@ -132,13 +371,16 @@ class GenericClimateOptionsFlow(config_entries.OptionsFlow):
         sensor_selector = selector.EntitySelector(
             selector.EntitySelectorConfig(domain="sensor")
         )
+        target_sensor_selector = selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="sensor", multiple=True)
+        )
 
         schema = vol.Schema(
             {
                 vol.Optional(CONF_NAME, default=current.get(CONF_NAME, DEFAULT_NAME)): cv.string,
                 vol.Optional(CONF_UNIQUE_ID, default=current.get(CONF_UNIQUE_ID) or self._config_entry.unique_id): cv.string,
                 vol.Optional(CONF_HEATER, default=current.get(CONF_HEATER)): switch_selector,
-                vol.Optional(CONF_SENSOR, default=current.get(CONF_SENSOR)): sensor_selector,
+                vol.Optional(CONF_SENSOR, default=target_sensors): target_sensor_selector,
                 vol.Optional(CONF_COOLER, default=current.get(CONF_COOLER)): switch_selector,
                 vol.Optional(
                     CONF_HUMIDITY_SENSOR,
@@ -158,10 +400,90 @@ class GenericClimateOptionsFlow(config_entries.OptionsFlow):
                 ): vol.Coerce(float),
                 vol.Optional(CONF_MIN_DUR, default=current.get(CONF_MIN_DUR)): cv.positive_time_period,
                 vol.Optional(CONF_KEEP_ALIVE, default=current.get(CONF_KEEP_ALIVE)): cv.positive_time_period,
+                vol.Optional(
+                    CONF_SENSOR_DEBOUNCE,
+                    default=current.get(CONF_SENSOR_DEBOUNCE),
+                ): cv.positive_time_period,
+                vol.Optional(
+                    CONF_PREDICTIVE_HORIZON,
+                    default=current.get(CONF_PREDICTIVE_HORIZON),
+                ): cv.positive_time_period,
+                vol.Optional(
+                    CONF_INSTRUMENTATION,
+                    default=current.get(CONF_INSTRUMENTATION, False),
+                ): cv.boolean,
+                vol.Optional(
+                    CONF_SENSOR_AGGREGATE,
+                    default=current.get(CONF_SENSOR_AGGREGATE, AGGREGATE_MEAN),
+                ): vol.In(AGGREGATES),
+                vol.Optional(
+                    CONF_SENSOR_WINDOW,
+                    default=current.get(CONF_SENSOR_WINDOW, 1),
+                ): cv.positive_int,
+                vol.Optional(
+                    CONF_SENSOR_OUTLIER_THRESHOLD,
+                    default=current.get(CONF_SENSOR_OUTLIER_THRESHOLD),
+                ): vol.Coerce(float),
+                vol.Optional(
+                    CONF_SENSOR_STALE_AFTER,
+                    default=current.get(CONF_SENSOR_STALE_AFTER),
+                ): cv.positive_time_period,
+                vol.Optional(
+                    CONF_STATE_TEMPERATURE_DELTA,
+                    default=current.get(CONF_STATE_TEMPERATURE_DELTA),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_STATE_HUMIDITY_DELTA,
+                    default=current.get(CONF_STATE_HUMIDITY_DELTA),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_WARM_START,
+                    default=current.get(CONF_WARM_START),
+                ): cv.positive_time_period,
+                vol.Optional(
+                    CONF_SENSOR_MAX_AGE,
+                    default=current.get(CONF_SENSOR_MAX_AGE),
+                ): cv.positive_time_period,
+                vol.Optional(
+                    CONF_FAILSAFE_DUTY_CYCLE,
+                    default=current.get(CONF_FAILSAFE_DUTY_CYCLE),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+                vol.Optional(
+                    CONF_SCHEDULE,
+                    default=current.get(CONF_SCHEDULE),
+                ): vol.All(selector.ObjectSelector(), SCHEDULE_SCHEMA),
+                vol.Optional(
+                    CONF_SCHEDULE_PREHEAT,
+                    default=current.get(CONF_SCHEDULE_PREHEAT),
+                ): cv.positive_time_period,
+                vol.Optional(
+                    CONF_DECISION_TRACE,
+                    default=current.get(CONF_DECISION_TRACE, DEFAULT_TRACE_SIZE),
+                ): cv.positive_int,
+                vol.Optional(
+                    CONF_PLANT_SWITCH,
+                    default=current.get(CONF_PLANT_SWITCH),
+                ): switch_selector,
+                vol.Optional(
+                    CONF_PLANT_MIN_CYCLE,
+                    default=current.get(CONF_PLANT_MIN_CYCLE),
+                ): cv.positive_time_period,
+                vol.Optional(
+                    CONF_DEMAND_WEIGHT,
+                    default=current.get(CONF_DEMAND_WEIGHT),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_OPEN_WINDOW_DROP,
+                    default=current.get(CONF_OPEN_WINDOW_DROP),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_OPEN_WINDOW_HOLD,
+                    default=current.get(CONF_OPEN_WINDOW_HOLD),
+                ): cv.positive_time_period,
                 vol.Optional(
                     CONF_INITIAL_HVAC_MODE,
                     default=current.get(CONF_INITIAL_HVAC_MODE),
-                ): vol.In(["off", "heat", "cool"]),
+                ): vol.In(INITIAL_HVAC_MODES),
                 vol.Optional(CONF_PRECISION, default=current.get(CONF_PRECISION)): vol.In(
                     [PRECISION_TENTHS, PRECISION_HALVES, PRECISION_WHOLE]
                 ),
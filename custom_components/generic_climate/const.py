@@ -0,0 +1,175 @@
+"""Constants and configuration schema for Generic Climate.
+
+Nothing here imports the climate platform or its helpers, so loading the
+integration, showing its config flow and setting up its sensors stays cheap.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import voluptuous as vol
+
+from homeassistant.const import (
+    CONF_NAME,
+    CONF_UNIQUE_ID,
+    PRECISION_HALVES,
+    PRECISION_TENTHS,
+    PRECISION_WHOLE,
+)
+import homeassistant.helpers.config_validation as cv
+
+from .aggregation import AGGREGATE_MEAN, AGGREGATES
+from .schedule import WeeklySchedule
+
+DOMAIN = "generic_climate"
+
+DEFAULT_TOLERANCE = 0.3
+DEFAULT_NAME = "Generic Climate"
+DEFAULT_TRACE_SIZE = 256
+DEFAULT_OPEN_WINDOW_HOLD = timedelta(minutes=15)
+
+CONF_HEATER = "heater"
+CONF_SENSOR = "target_sensor"
+CONF_MIN_TEMP = "min_temp"
+CONF_MAX_TEMP = "max_temp"
+CONF_TARGET_TEMP = "target_temp"
+CONF_MIN_DUR = "min_cycle_duration"
+CONF_COLD_TOLERANCE = "cold_tolerance"
+CONF_HOT_TOLERANCE = "hot_tolerance"
+CONF_KEEP_ALIVE = "keep_alive"
+CONF_INITIAL_HVAC_MODE = "initial_hvac_mode"
+CONF_AWAY_TEMP = "away_temp"
+CONF_PRECISION = "precision"
+CONF_SENSOR_DEBOUNCE = "sensor_debounce"
+CONF_PREDICTIVE_HORIZON = "predictive_horizon"
+CONF_INSTRUMENTATION = "instrumentation"
+CONF_SENSOR_AGGREGATE = "sensor_aggregate"
+CONF_SENSOR_WINDOW = "sensor_window"
+CONF_SENSOR_OUTLIER_THRESHOLD = "sensor_outlier_threshold"
+CONF_SENSOR_STALE_AFTER = "sensor_stale_after"
+CONF_STATE_TEMPERATURE_DELTA = "state_temperature_delta"
+CONF_WARM_START = "warm_start"
+CONF_SENSOR_MAX_AGE = "sensor_max_age"
+CONF_FAILSAFE_DUTY_CYCLE = "failsafe_duty_cycle"
+CONF_SCHEDULE = "schedule"
+CONF_SCHEDULE_PREHEAT = "schedule_preheat"
+CONF_DECISION_TRACE = "decision_trace"
+CONF_PLANT_SWITCH = "plant_switch"
+CONF_PLANT_MIN_CYCLE = "plant_min_cycle"
+CONF_DEMAND_WEIGHT = "demand_weight"
+CONF_OPEN_WINDOW_DROP = "open_window_drop"
+CONF_OPEN_WINDOW_HOLD = "open_window_hold"
+CONF_STATE_HUMIDITY_DELTA = "state_humidity_delta"
+CONF_ZONES = "zones"
+CONF_COOLER = "cooler"
+CONF_HUMIDITY_SENSOR = "humidity_sensor"
+CONF_ENTITY_UNIQUE_ID = CONF_UNIQUE_ID
+
+# The values of HVACMode, spelled out so the climate component is not
+# imported to validate them.
+INITIAL_HVAC_MODES = ["off", "heat", "cool"]
+
+# Options that need the entity recreated rather than updated in place.
+RELOAD_OPTIONS = {CONF_UNIQUE_ID, CONF_INSTRUMENTATION, CONF_PLANT_SWITCH}
+
+# Options holding a duration. Config entries store them in seconds, since
+# their storage cannot encode a timedelta.
+DURATION_OPTIONS = {
+    CONF_MIN_DUR,
+    CONF_KEEP_ALIVE,
+    CONF_SENSOR_DEBOUNCE,
+    CONF_PREDICTIVE_HORIZON,
+    CONF_SENSOR_STALE_AFTER,
+    CONF_WARM_START,
+    CONF_SENSOR_MAX_AGE,
+    CONF_SCHEDULE_PREHEAT,
+    CONF_PLANT_MIN_CYCLE,
+    CONF_OPEN_WINDOW_HOLD,
+}
+
+
+def storable(data: dict) -> dict:
+    """Return config entry data with its durations in seconds."""
+    return {
+        key: value.total_seconds() if isinstance(value, timedelta) else value
+        for key, value in data.items()
+    }
+
+
+def entry_config(config_entry) -> dict:
+    """Return a config entry's data and options, durations as timedelta."""
+    data = {**config_entry.data, **config_entry.options}
+    for key in DURATION_OPTIONS:
+        if data.get(key) is not None:
+            data[key] = cv.positive_time_period(data[key])
+    return data
+
+
+def _validate_schedule(value):
+    """Check that a weekly schedule compiles."""
+    try:
+        WeeklySchedule(value)
+    except (AttributeError, TypeError, ValueError) as err:
+        raise vol.Invalid(f"invalid schedule: {err}") from err
+    return value
+
+
+SCHEDULE_SCHEMA = vol.All(
+    vol.Schema({cv.string: {cv.string: vol.Coerce(float)}}), _validate_schedule
+)
+
+ENTITY_OPTIONS = {
+    vol.Optional(CONF_HEATER): cv.entity_id,
+    vol.Optional(CONF_SENSOR): cv.entity_ids,
+    vol.Optional(CONF_ENTITY_UNIQUE_ID): cv.string,
+    vol.Optional(CONF_MAX_TEMP): vol.Coerce(float),
+    vol.Optional(CONF_MIN_DUR): cv.positive_time_period,
+    vol.Optional(CONF_MIN_TEMP): vol.Coerce(float),
+    vol.Optional(CONF_NAME, default=DEFAULT_NAME): cv.string,
+    vol.Optional(CONF_COLD_TOLERANCE, default=DEFAULT_TOLERANCE): vol.Coerce(float),
+    vol.Optional(CONF_HOT_TOLERANCE, default=DEFAULT_TOLERANCE): vol.Coerce(float),
+    vol.Optional(CONF_TARGET_TEMP): vol.Coerce(float),
+    vol.Optional(CONF_KEEP_ALIVE): cv.positive_time_period,
+    vol.Optional(CONF_INITIAL_HVAC_MODE): vol.In(INITIAL_HVAC_MODES),
+    vol.Optional(CONF_AWAY_TEMP): vol.Coerce(float),
+    vol.Optional(CONF_PRECISION): vol.In(
+        [PRECISION_TENTHS, PRECISION_HALVES, PRECISION_WHOLE]
+    ),
+    vol.Optional(CONF_COOLER): cv.entity_id,
+    vol.Optional(CONF_HUMIDITY_SENSOR): cv.entity_id,
+    vol.Optional(CONF_SENSOR_DEBOUNCE): cv.positive_time_period,
+    vol.Optional(CONF_PREDICTIVE_HORIZON): cv.positive_time_period,
+    vol.Optional(CONF_INSTRUMENTATION, default=False): cv.boolean,
+    vol.Optional(CONF_SENSOR_AGGREGATE, default=AGGREGATE_MEAN): vol.In(
+        AGGREGATES
+    ),
+    vol.Optional(CONF_SENSOR_WINDOW, default=1): cv.positive_int,
+    vol.Optional(CONF_SENSOR_OUTLIER_THRESHOLD): vol.Coerce(float),
+    vol.Optional(CONF_SENSOR_STALE_AFTER): cv.positive_time_period,
+    vol.Optional(CONF_STATE_TEMPERATURE_DELTA): vol.All(
+        vol.Coerce(float), vol.Range(min=0)
+    ),
+    vol.Optional(CONF_STATE_HUMIDITY_DELTA): vol.All(
+        vol.Coerce(float), vol.Range(min=0)
+    ),
+    vol.Optional(CONF_WARM_START): cv.positive_time_period,
+    vol.Optional(CONF_SENSOR_MAX_AGE): cv.positive_time_period,
+    vol.Optional(CONF_FAILSAFE_DUTY_CYCLE): vol.All(
+        vol.Coerce(float), vol.Range(min=0, max=100)
+    ),
+    vol.Optional(CONF_SCHEDULE): SCHEDULE_SCHEMA,
+    vol.Optional(CONF_SCHEDULE_PREHEAT): cv.positive_time_period,
+    vol.Optional(CONF_DECISION_TRACE): cv.positive_int,
+    vol.Optional(CONF_PLANT_SWITCH): cv.entity_id,
+    vol.Optional(CONF_PLANT_MIN_CYCLE): cv.positive_time_period,
+    vol.Optional(CONF_DEMAND_WEIGHT): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    vol.Optional(CONF_OPEN_WINDOW_DROP): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    vol.Optional(CONF_OPEN_WINDOW_HOLD): cv.positive_time_period,
+}
+
+# Zone entries take the same options without defaults, so anything they
+# leave out is inherited from the platform block.
+ZONE_SCHEMA = vol.Schema(
+    {vol.Optional(str(key)): value for key, value in ENTITY_OPTIONS.items()}
+)
@@ -0,0 +1,226 @@
+"""Shared control coordinator for Generic Climate zones."""
+
+from __future__ import annotations
+
+from array import array
+import asyncio
+from typing import Any
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import restore_state
+
+from .demand import PlantDemand
+from .dispatcher import CommandDispatcher
+from .scheduler import DeadlineScheduler
+
+NAN = float("nan")
+
+DECISION_HOLD = 0
+DECISION_TURN_ON = 1
+DECISION_TURN_OFF = 2
+
+MODES = (None, HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL)
+MODE_OFF = MODES.index(HVACMode.OFF)
+MODE_COOL = MODES.index(HVACMode.COOL)
+
+# Per-zone column -> value of an empty slot.
+COLUMNS = {
+    "cur_temp": NAN,
+    "target_temp": NAN,
+    "cold_tolerance": NAN,
+    "hot_tolerance": NAN,
+    "predicted_delta": 0.0,
+    "hvac_mode": 0,
+    "device_active": 0,
+}
+
+
+def decide(
+    cur: float,
+    target: float,
+    cold_tolerance: float,
+    hot_tolerance: float,
+    cooling: bool,
+    active: bool,
+) -> int:
+    """Return the hysteresis decision for one zone.
+
+    This is the whole on/off rule, shared by the coordinator and the
+    offline tuner so that replays decide exactly like live zones.
+    """
+    too_cold = target >= cur + cold_tolerance
+    too_hot = cur >= target + hot_tolerance
+    if cooling:
+        stop, start = too_cold, too_hot
+    else:
+        stop, start = too_hot, too_cold
+    if active:
+        return DECISION_TURN_OFF if stop else DECISION_HOLD
+    return DECISION_TURN_ON if start else DECISION_HOLD
+
+
+class GenericClimateCoordinator:
+    """Keep the control state of every zone and evaluate dirty zones in batches.
+
+    Each zone owns one slot in a set of parallel arrays. Entities mark their
+    zone dirty through `async_evaluate` and all zones that became dirty in the
+    same event loop iteration are decided in a single pass.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        # Config entry id -> climate entity of that entry.
+        self.entities: dict[str, Any] = {}
+        self.dispatcher = CommandDispatcher(hass)
+        self.scheduler = DeadlineScheduler(hass)
+        # Plant switch entity id (None for zones without one) -> demand.
+        self.plants: dict[str | None, PlantDemand] = {}
+        self.cur_temp = array("d")
+        self.target_temp = array("d")
+        self.cold_tolerance = array("d")
+        self.hot_tolerance = array("d")
+        self.predicted_delta = array("d")
+        self.hvac_mode = array("b")
+        self.device_active = array("b")
+        self._free: list[int] = []
+        self._dirty: list[int] = []
+        self._pending: dict[int, asyncio.Future] = {}
+        self._tick_handle: asyncio.Handle | None = None
+
+    @property
+    def zone_count(self) -> int:
+        """Return the number of zones currently registered."""
+        return len(self.cur_temp) - len(self._free)
+
+    @callback
+    def async_restored(self, entity_id: str) -> restore_state.StoredState | None:
+        """Return what was saved for a zone entity before the last shutdown.
+
+        Saved states are loaded once for the whole instance, so zones read
+        their state and extra data in one synchronous lookup instead of
+        awaiting the restore store separately for each.
+        """
+        return restore_state.async_get(self.hass).last_states.get(entity_id)
+
+    @callback
+    def async_get_plant(self, switch_entity_id: str | None) -> PlantDemand:
+        """Return the demand of the plant behind a switch, creating it on first use."""
+        if (plant := self.plants.get(switch_entity_id)) is None:
+            plant = self.plants[switch_entity_id] = PlantDemand(
+                self.hass, self.scheduler, self.dispatcher, switch_entity_id
+            )
+        return plant
+
+    @callback
+    def async_add_zone(self, values: dict[str, float] | None = None) -> int:
+        """Allocate a slot for a zone, fill it from values and return its index."""
+        if self._free:
+            zone = self._free.pop()
+        else:
+            zone = len(self.cur_temp)
+            for column, default in COLUMNS.items():
+                getattr(self, column).append(default)
+        values = values or {}
+        for column, default in COLUMNS.items():
+            getattr(self, column)[zone] = values.get(column, default)
+        return zone
+
+    @callback
+    def async_remove_zone(self, zone: int) -> dict[str, float]:
+        """Release the slot of a removed zone and return what it held."""
+        if (future := self._pending.pop(zone, None)) is not None:
+            future.cancel()
+        values = {column: getattr(self, column)[zone] for column in COLUMNS}
+        for column, default in COLUMNS.items():
+            getattr(self, column)[zone] = default
+        self._free.append(zone)
+        return values
+
+    @callback
+    def async_evaluate(self, zone: int) -> asyncio.Future:
+        """Mark a zone dirty and return a future resolving to its decision."""
+        if (future := self._pending.get(zone)) is None:
+            future = self._pending[zone] = self.hass.loop.create_future()
+            self._dirty.append(zone)
+        if self._tick_handle is None:
+            self._tick_handle = self.hass.loop.call_soon(self._async_tick)
+        return future
+
+    @callback
+    def _async_tick(self) -> None:
+        """Decide every dirty zone in one pass over the arrays."""
+        self._tick_handle = None
+        dirty, self._dirty = self._dirty, []
+        pending, self._pending = self._pending, {}
+        cur_temp = self.cur_temp
+        target_temp = self.target_temp
+        cold_tolerance = self.cold_tolerance
+        hot_tolerance = self.hot_tolerance
+        predicted_delta = self.predicted_delta
+        hvac_mode = self.hvac_mode
+        device_active = self.device_active
+
+        for zone in dirty:
+            future = pending.get(zone)
+            if future is None or future.done():
+                continue
+            if hvac_mode[zone] == MODE_OFF:
+                # Switched off since the zone was marked dirty.
+                future.set_result(DECISION_HOLD)
+                continue
+            # Predictive zones decide on where the temperature is heading.
+            future.set_result(
+                decide(
+                    cur_temp[zone] + predicted_delta[zone],
+                    target_temp[zone],
+                    cold_tolerance[zone],
+                    hot_tolerance[zone],
+                    hvac_mode[zone] == MODE_COOL,
+                    device_active[zone],
+                )
+            )
+
+
+class ZoneField:
+    """Expose one numeric coordinator column as an attribute of a zone entity.
+
+    `None` is stored as NaN so the column stays a compact array of doubles.
+    While the entity has no slot, before it is added or after it is removed,
+    the value is kept in its `_zone_values` and moves into the next slot.
+    """
+
+    def __init__(self, column: str) -> None:
+        self._column = column
+
+    def _load(self, obj):
+        if obj._zone is None:
+            return obj._zone_values.get(self._column, COLUMNS[self._column])
+        return getattr(obj._coordinator, self._column)[obj._zone]
+
+    def _store(self, obj, value) -> None:
+        if obj._zone is None:
+            obj._zone_values[self._column] = value
+        else:
+            getattr(obj._coordinator, self._column)[obj._zone] = value
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = self._load(obj)
+        return None if value != value else value
+
+    def __set__(self, obj, value) -> None:
+        self._store(obj, NAN if value is None else value)
+
+
+class ZoneModeField(ZoneField):
+    """Expose the coordinator's HVAC mode column as an `HVACMode`."""
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return MODES[self._load(obj)]
+
+    def __set__(self, obj, value) -> None:
+        self._store(obj, MODES.index(value))
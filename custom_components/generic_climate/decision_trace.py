@@ -0,0 +1,106 @@
+"""Fixed-size binary trace of a zone's control decisions."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import struct
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.const import SERVICE_TURN_OFF, SERVICE_TURN_ON
+
+from .const import DEFAULT_TRACE_SIZE
+from .instrumentation import (
+    OUTCOME_FAILSAFE,
+    OUTCOME_HOLD,
+    OUTCOME_INACTIVE,
+    OUTCOME_KEEP_ALIVE,
+    OUTCOME_MIN_CYCLE,
+    OUTCOME_OPEN_WINDOW,
+    OUTCOME_TURN_OFF,
+    OUTCOME_TURN_ON,
+)
+
+# Codes are part of the record format; only ever append to these.
+REASONS = (
+    None,
+    OUTCOME_TURN_ON,
+    OUTCOME_TURN_OFF,
+    OUTCOME_HOLD,
+    OUTCOME_KEEP_ALIVE,
+    OUTCOME_MIN_CYCLE,
+    OUTCOME_INACTIVE,
+    OUTCOME_FAILSAFE,
+    OUTCOME_OPEN_WINDOW,
+)
+ACTIONS = (None, SERVICE_TURN_ON, SERVICE_TURN_OFF)
+MODES = (None, HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL)
+
+_REASON_CODES = {reason: code for code, reason in enumerate(REASONS)}
+_ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+_MODE_CODES = {mode: code for code, mode in enumerate(MODES)}
+
+# Timestamp, current and target temperature, mode, reason and action.
+RECORD = struct.Struct("<dffBBB")
+NAN = float("nan")
+
+
+class DecisionTrace:
+    """Ring buffer of the last `size` control decisions of a zone.
+
+    Records are packed into one preallocated bytearray, so recording costs
+    no allocation and the memory used is fixed at `size * RECORD.size`
+    bytes. Records are only decoded when the trace is dumped.
+    """
+
+    __slots__ = ("_buffer", "_size", "_next", "count")
+
+    def __init__(self, size: int = DEFAULT_TRACE_SIZE) -> None:
+        self._buffer = bytearray(size * RECORD.size)
+        self._size = size
+        self._next = 0
+        # Total decisions recorded, including overwritten ones.
+        self.count = 0
+
+    def record(
+        self,
+        timestamp: float,
+        current: float | None,
+        target: float | None,
+        mode: HVACMode | None,
+        reason: str,
+        action: str | None = None,
+    ) -> None:
+        """Append one decision, overwriting the oldest when full."""
+        RECORD.pack_into(
+            self._buffer,
+            self._next * RECORD.size,
+            timestamp,
+            NAN if current is None else current,
+            NAN if target is None else target,
+            _MODE_CODES.get(mode, 0),
+            _REASON_CODES.get(reason, 0),
+            _ACTION_CODES.get(action, 0),
+        )
+        self._next = (self._next + 1) % self._size
+        self.count += 1
+
+    def records(self) -> list[dict]:
+        """Decode the buffered decisions, oldest first."""
+        used = min(self.count, self._size)
+        start = (self._next - used) % self._size
+        result = []
+        for offset in range(used):
+            timestamp, current, target, mode, reason, action = RECORD.unpack_from(
+                self._buffer, (start + offset) % self._size * RECORD.size
+            )
+            result.append(
+                {
+                    "time": datetime.fromtimestamp(timestamp, timezone.utc).isoformat(),
+                    "current_temperature": None if current != current else round(current, 2),
+                    "target_temperature": None if target != target else round(target, 2),
+                    "hvac_mode": MODES[mode] if mode < len(MODES) else None,
+                    "reason": REASONS[reason] if reason < len(REASONS) else None,
+                    "action": ACTIONS[action] if action < len(ACTIONS) else None,
+                }
+            )
+        return result
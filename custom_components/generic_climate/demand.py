@@ -0,0 +1,192 @@
+"""Aggregate heat demand of Generic Climate zones sharing a plant."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from datetime import timedelta
+import logging
+
+from homeassistant.const import SERVICE_TURN_OFF, SERVICE_TURN_ON, STATE_ON
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
+
+from .dispatcher import CommandDispatcher
+from .scheduler import DeadlineScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PlantDemand:
+    """Heat demand of the zones sharing one boiler or other plant.
+
+    Zones report their heater switching on and off. The number of calling
+    zones and the summed demand weight of those zones are kept as running
+    totals, so a report costs O(1) however many zones share the plant.
+
+    With a plant switch, the switch is turned on while any zone calls for
+    heat and off once none does. Each state is held for at least the
+    longest `min_cycle` of the zones on the plant.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        scheduler: DeadlineScheduler,
+        dispatcher: CommandDispatcher,
+        switch_entity_id: str | None = None,
+    ) -> None:
+        self.hass = hass
+        self.switch_entity_id = switch_entity_id
+        self.min_cycle: timedelta | None = None
+        self.calling = 0
+        self.weighted = 0.0
+        self.total_weight = 0.0
+        # Config entry whose sensor platform exposes this plant.
+        self.sensor_entry_id: str | None = None
+        # Config entry id -> entity adder of its sensor platform, so the
+        # sensor can move to another zone when its own goes away.
+        self.sensor_platforms: dict[str, Callable[[list], None]] = {}
+        self._scheduler = scheduler
+        self._dispatcher = dispatcher
+        # Zone -> [weight, calling, min_cycle].
+        self._zones: dict[Hashable, list] = {}
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._unsub_switch: CALLBACK_TYPE | None = None
+
+    @property
+    def zones(self) -> int:
+        """Return the number of zones on the plant."""
+        return len(self._zones)
+
+    @property
+    def demand(self) -> float:
+        """Return the weight of calling zones as a percentage of all zones."""
+        if not self.total_weight:
+            return 0.0
+        return round(self.weighted / self.total_weight * 100, 1)
+
+    @callback
+    def async_add_listener(self, update: CALLBACK_TYPE) -> Callable[[], None]:
+        """Call update whenever the demand changes; return a remover."""
+        self._listeners.append(update)
+
+        @callback
+        def _async_remove() -> None:
+            self._listeners.remove(update)
+
+        return _async_remove
+
+    @callback
+    def async_join(
+        self,
+        zone: Hashable,
+        weight: float,
+        min_cycle: timedelta | None = None,
+        calling: bool = False,
+    ) -> None:
+        """Add a zone with its demand weight and the plant cycle it asks for."""
+        self.async_leave(zone)
+        self._zones[zone] = [weight, False, min_cycle]
+        self.total_weight += weight
+        self._update_min_cycle()
+        if self.switch_entity_id is not None and self._unsub_switch is None:
+            # Re-check the plant whenever its switch changes, e.g. once a
+            # command lands after the demand it answered has gone away.
+            self._unsub_switch = async_track_state_change_event(
+                self.hass, [self.switch_entity_id], self._async_switch_changed
+            )
+        if calling:
+            self.async_set_calling(zone, True)
+        else:
+            self._async_changed()
+
+    @callback
+    def async_leave(self, zone: Hashable) -> None:
+        """Remove a zone, withdrawing its call for heat."""
+        if zone not in self._zones:
+            return
+        self.async_set_calling(zone, False)
+        weight = self._zones.pop(zone)[0]
+        self.total_weight = self.total_weight - weight if self._zones else 0.0
+        self._update_min_cycle()
+        if not self._zones:
+            if self._unsub_switch is not None:
+                self._unsub_switch()
+                self._unsub_switch = None
+            self._scheduler.async_cancel((self, "min_cycle"))
+        self._async_changed()
+
+    @callback
+    def async_set_calling(self, zone: Hashable, calling: bool) -> None:
+        """Record a zone's heater switching on or off."""
+        entry = self._zones.get(zone)
+        if entry is None or entry[1] == calling:
+            return
+        entry[1] = calling
+        if calling:
+            self.calling += 1
+            self.weighted += entry[0]
+        else:
+            self.calling -= 1
+            # Keep repeated additions and subtractions from drifting off zero.
+            self.weighted = self.weighted - entry[0] if self.calling else 0.0
+        self._async_changed()
+
+    def _update_min_cycle(self) -> None:
+        self.min_cycle = max(
+            (entry[2] for entry in self._zones.values() if entry[2]), default=None
+        )
+
+    @callback
+    def _async_changed(self) -> None:
+        for update in list(self._listeners):
+            update()
+        self._async_control()
+
+    @callback
+    def _async_switch_changed(self, event) -> None:
+        self._async_control()
+
+    @callback
+    def _async_control(self, _now=None) -> None:
+        """Switch the plant to follow the demand, respecting its min cycle."""
+        if self.switch_entity_id is None:
+            return
+        self._scheduler.async_cancel((self, "min_cycle"))
+        if not self._zones:
+            return
+        wanted = self.calling > 0
+        state = self.hass.states.get(self.switch_entity_id)
+        if wanted == (state is not None and state.state == STATE_ON):
+            return
+        if self.min_cycle and state is not None:
+            remaining = (
+                state.last_changed + self.min_cycle - dt_util.utcnow()
+            ).total_seconds()
+            if remaining > 0:
+                self._scheduler.async_schedule(
+                    (self, "min_cycle"), remaining, self._async_control
+                )
+                return
+        self.hass.async_create_task(
+            self._async_send(SERVICE_TURN_ON if wanted else SERVICE_TURN_OFF)
+        )
+
+    async def _async_send(self, service: str) -> None:
+        try:
+            await self._dispatcher.async_command(self.switch_entity_id, service)
+        except HomeAssistantError as err:
+            _LOGGER.warning("Unable to %s %s: %s", service, self.switch_entity_id, err)
+
+    def as_dict(self) -> dict:
+        """Return the plant's demand for diagnostics."""
+        return {
+            "plant_switch": self.switch_entity_id,
+            "zones": self.zones,
+            "calling_zones": self.calling,
+            "weighted_demand": self.weighted,
+            "demand": self.demand,
+            "min_cycle": str(self.min_cycle) if self.min_cycle else None,
+        }
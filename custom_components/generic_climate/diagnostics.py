@@ -0,0 +1,39 @@
+"""Diagnostics support for Generic Climate."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import async_get_coordinator
+
+
+def _serializable(data) -> dict[str, Any]:
+    return {
+        key: str(value) if isinstance(value, timedelta) else value
+        for key, value in data.items()
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = async_get_coordinator(hass)
+    entity = coordinator.entities.get(entry.entry_id)
+
+    return {
+        "entry": {
+            "data": _serializable(entry.data),
+            "options": _serializable(entry.options),
+        },
+        "coordinator": {
+            "zones": coordinator.zone_count,
+            "dispatcher": coordinator.dispatcher.stats,
+            "scheduled_deadlines": len(coordinator.scheduler),
+        },
+        "zone": entity.diagnostics() if entity is not None else None,
+    }
@@ -0,0 +1,88 @@
+"""Batched actuator command dispatcher for Generic Climate zones."""
+
+from __future__ import annotations
+
+import asyncio
+
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.core import DOMAIN as HA_DOMAIN, Context, HomeAssistant, callback
+
+_SERVICE_STATE = {SERVICE_TURN_ON: STATE_ON, SERVICE_TURN_OFF: STATE_OFF}
+
+
+class CommandDispatcher:
+    """Merge switch commands issued in one loop iteration into few service calls.
+
+    The latest command per entity wins. When the batch is flushed, commands
+    whose target state already matches the state machine are dropped and the
+    remaining ones are sent as one `homeassistant.turn_on` / `turn_off` call
+    per service with a list of entity ids.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self.issued = 0
+        self.suppressed = 0
+        self._pending: dict[str, tuple[str, Context | None]] = {}
+        self._future: asyncio.Future | None = None
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return the number of issued service calls and suppressed commands."""
+        return {"issued": self.issued, "suppressed": self.suppressed}
+
+    @callback
+    def async_command(
+        self, entity_id: str, service: str, context: Context | None = None
+    ) -> asyncio.Future:
+        """Queue a command and return a future done once its batch is sent."""
+        if entity_id in self._pending:
+            # Superseded within the same batch.
+            self.suppressed += 1
+        self._pending[entity_id] = (service, context)
+        if self._future is None:
+            self._future = self.hass.loop.create_future()
+            self.hass.async_create_task(self._async_flush())
+        return self._future
+
+    async def _async_flush(self) -> None:
+        """Send all queued commands."""
+        pending, self._pending = self._pending, {}
+        future, self._future = self._future, None
+
+        batches: dict[str, tuple[list[str], Context | None]] = {}
+        for entity_id, (service, context) in pending.items():
+            if self.hass.states.is_state(entity_id, _SERVICE_STATE[service]):
+                self.suppressed += 1
+                continue
+            if (batch := batches.get(service)) is None:
+                batches[service] = ([entity_id], context)
+                continue
+            batch[0].append(entity_id)
+            if batch[1] is not context:
+                # Commands from different zones share no single context.
+                batches[service] = (batch[0], None)
+
+        self.issued += len(batches)
+        try:
+            await asyncio.gather(
+                *(
+                    self.hass.services.async_call(
+                        HA_DOMAIN,
+                        service,
+                        {ATTR_ENTITY_ID: entity_ids},
+                        context=context,
+                    )
+                    for service, (entity_ids, context) in batches.items()
+                )
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            future.set_exception(err)
+        else:
+            future.set_result(None)
@@ -0,0 +1,113 @@
+"""Hot-path instrumentation for Generic Climate zones."""
+
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from time import perf_counter
+
+# Upper bucket bounds in milliseconds; the last bucket is unbounded.
+BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000, 30000)
+
+OUTCOME_TURN_ON = "turn_on"
+OUTCOME_TURN_OFF = "turn_off"
+OUTCOME_HOLD = "hold"
+OUTCOME_KEEP_ALIVE = "keep_alive"
+OUTCOME_MIN_CYCLE = "min_cycle"
+OUTCOME_INACTIVE = "inactive"
+OUTCOME_FAILSAFE = "failsafe"
+OUTCOME_OPEN_WINDOW = "open_window"
+
+
+class Histogram:
+    """Fixed-bucket latency histogram."""
+
+    def __init__(self) -> None:
+        self.counts = array("L", [0] * (len(BUCKETS_MS) + 1))
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration."""
+        millis = seconds * 1000
+        index = 0
+        for bound in BUCKETS_MS:
+            if millis <= bound:
+                break
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += millis
+        if millis > self.max:
+            self.max = millis
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean in milliseconds."""
+        return self.total / self.count if self.count else None
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the upper bound of the bucket holding the given percentile."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS_MS, self.counts):
+            seen += count
+            if seen >= rank:
+                return float(bound)
+        return self.max
+
+    def as_dict(self) -> dict:
+        """Return the histogram for diagnostics."""
+        return {
+            "count": self.count,
+            "mean_ms": self.mean,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": self.max,
+            "buckets_ms": {
+                **{f"le_{bound}": count for bound, count in zip(BUCKETS_MS, self.counts)},
+                "inf": self.counts[-1],
+            },
+        }
+
+
+class ZoneMetrics:
+    """Counters and histograms of one zone's control path."""
+
+    def __init__(self) -> None:
+        self.event_to_decision = Histogram()
+        self.lock_wait = Histogram()
+        self.service_call = Histogram()
+        self.outcomes: Counter[str] = Counter()
+
+    def as_dict(self) -> dict:
+        """Return all metrics for diagnostics."""
+        return {
+            "event_to_decision": self.event_to_decision.as_dict(),
+            "lock_wait": self.lock_wait.as_dict(),
+            "service_call": self.service_call.as_dict(),
+            "outcomes": dict(self.outcomes),
+        }
+
+
+class InstrumentedLock:
+    """Async context manager timing how long a lock takes to acquire."""
+
+    def __init__(self, lock, histogram: Histogram) -> None:
+        self._lock = lock
+        self._histogram = histogram
+
+    def locked(self) -> bool:
+        """Return True if the lock is held."""
+        return self._lock.locked()
+
+    async def __aenter__(self):
+        start = perf_counter()
+        await self._lock.acquire()
+        self._histogram.observe(perf_counter() - start)
+
+    async def __aexit__(self, *exc_info):
+        self._lock.release()
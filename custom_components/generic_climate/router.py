@@ -0,0 +1,67 @@
+"""Shared state change subscription for multi-zone platforms."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+
+class StateChangeRouter:
+    """Route state changes of many entities to the zones that watch them.
+
+    The router holds a single state change subscription for every entity id
+    it was created with and an index from entity id to zone handlers, so the
+    number of listeners grows with the number of unique entities rather
+    than with the number of zones.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_ids: Iterable[str]) -> None:
+        self.hass = hass
+        self._entity_ids = set(entity_ids)
+        self._handlers: dict[str, list[HassJob]] = {}
+        self._unsubs = [
+            async_track_state_change_event(
+                hass, sorted(self._entity_ids), self._async_route
+            )
+        ]
+
+    @callback
+    def async_track(self, entity_ids: Iterable[str], action: Callable) -> CALLBACK_TYPE:
+        """Call action on state changes of entity_ids; return a remover."""
+        entity_ids = list(entity_ids)
+        if missing := [e for e in entity_ids if e not in self._entity_ids]:
+            # Only ids the router was not created with cost a subscription.
+            self._entity_ids.update(missing)
+            self._unsubs.append(
+                async_track_state_change_event(self.hass, missing, self._async_route)
+            )
+        job = HassJob(action)
+        for entity_id in entity_ids:
+            self._handlers.setdefault(entity_id, []).append(job)
+
+        @callback
+        def _async_remove() -> None:
+            for entity_id in entity_ids:
+                handlers = self._handlers[entity_id]
+                handlers.remove(job)
+                if not handlers:
+                    del self._handlers[entity_id]
+            if not self._handlers:
+                self._async_close()
+
+        return _async_remove
+
+    @callback
+    def _async_close(self) -> None:
+        """Drop the subscription once no zone is left."""
+        while self._unsubs:
+            self._unsubs.pop()()
+        self._entity_ids.clear()
+
+    @callback
+    def _async_route(self, event) -> None:
+        """Hand a state change to every zone watching the entity."""
+        for job in tuple(self._handlers.get(event.data["entity_id"], ())):
+            self.hass.async_run_hass_job(job, event)
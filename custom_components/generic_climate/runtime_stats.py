@@ -0,0 +1,154 @@
+"""Rolling runtime statistics of Generic Climate actuators."""
+
+from __future__ import annotations
+
+from array import array
+
+WINDOW_1H = 3600
+WINDOW_24H = 86400
+WINDOW_7D = 604800
+WINDOWS = {"1h": WINDOW_1H, "24h": WINDOW_24H, "7d": WINDOW_7D}
+
+
+class _Buckets:
+    """Ring of fixed-width time buckets holding on-time and cycle starts."""
+
+    __slots__ = ("width", "on_time", "cycles", "index")
+
+    def __init__(self, width: int, count: int) -> None:
+        self.width = width
+        self.on_time = array("d", [0.0] * count)
+        self.cycles = array("L", [0] * count)
+        # Absolute number of the newest bucket.
+        self.index = 0
+
+    def _advance(self, index: int) -> None:
+        """Make index the newest bucket, clearing the buckets it reuses."""
+        if index <= self.index:
+            return
+        count = len(self.cycles)
+        for absolute in range(max(self.index + 1, index - count + 1), index + 1):
+            self.on_time[absolute % count] = 0.0
+            self.cycles[absolute % count] = 0
+        self.index = index
+
+    def add_cycle(self, timestamp: float) -> None:
+        """Count an actuator start."""
+        index = int(timestamp // self.width)
+        self._advance(index)
+        if index > self.index - len(self.cycles):
+            self.cycles[index % len(self.cycles)] += 1
+
+    def add_on_time(self, start: float, end: float) -> None:
+        """Spread the on period [start, end) over the buckets it covers."""
+        count = len(self.cycles)
+        self._advance(int(end // self.width))
+        start = max(start, (self.index - count + 1) * self.width)
+        while start < end:
+            index = int(start // self.width)
+            boundary = min((index + 1) * self.width, end)
+            self.on_time[index % count] += boundary - start
+            start = boundary
+
+    def totals(self, now: float, buckets: int) -> tuple[float, int]:
+        """Return on-time and starts over the newest `buckets` buckets."""
+        self._advance(int(now // self.width))
+        count = len(self.cycles)
+        slots = [(self.index - offset) % count for offset in range(buckets)]
+        return (
+            sum(self.on_time[slot] for slot in slots),
+            sum(self.cycles[slot] for slot in slots),
+        )
+
+    def as_dict(self) -> dict:
+        """Return the buckets for persisting."""
+        return {
+            "index": self.index,
+            "on_time": list(self.on_time),
+            "cycles": list(self.cycles),
+        }
+
+    def restore(self, data: dict) -> None:
+        """Restore buckets returned by `as_dict`."""
+        on_time = data.get("on_time") or []
+        cycles = data.get("cycles") or []
+        if len(on_time) != len(self.on_time) or len(cycles) != len(self.cycles):
+            return
+        self.index = int(data["index"])
+        self.on_time = array("d", (float(value) for value in on_time))
+        self.cycles = array("L", (int(value) for value in cycles))
+
+
+class RuntimeStats:
+    """Track how long and how often an actuator ran over 1h, 24h and 7d.
+
+    Transitions are accounted for as they happen: a start bumps one bucket
+    and a stop adds its on period to the buckets it spans, so nothing is
+    ever recomputed from history. The last hour is kept per minute, the
+    last week per hour.
+    """
+
+    def __init__(self) -> None:
+        self._minutes = _Buckets(60, WINDOW_1H // 60)
+        self._hours = _Buckets(3600, WINDOW_7D // 3600)
+        self._on_since: float | None = None
+
+    def transition(self, is_on: bool, timestamp: float) -> None:
+        """Record the actuator switching on or off at timestamp."""
+        if is_on:
+            if self._on_since is None:
+                self._on_since = timestamp
+                self._minutes.add_cycle(timestamp)
+                self._hours.add_cycle(timestamp)
+        elif self._on_since is not None:
+            self._accrue(timestamp)
+            self._on_since = None
+
+    def _accrue(self, now: float) -> None:
+        """Book the running on period up to now."""
+        if self._on_since is None or now <= self._on_since:
+            return
+        self._minutes.add_on_time(self._on_since, now)
+        self._hours.add_on_time(self._on_since, now)
+        self._on_since = now
+
+    def window(self, now: float, seconds: int) -> tuple[float, int]:
+        """Return on-time in seconds and the number of starts over a window."""
+        self._accrue(now)
+        if seconds <= WINDOW_1H:
+            return self._minutes.totals(now, seconds // self._minutes.width)
+        return self._hours.totals(now, seconds // self._hours.width)
+
+    def summary(self, now: float) -> dict:
+        """Return on-time, starts, duty cycle and starts per hour per window."""
+        result = {}
+        for name, seconds in WINDOWS.items():
+            on_time, cycles = self.window(now, seconds)
+            result[name] = {
+                "on_time": round(on_time),
+                "cycles": cycles,
+                "duty_cycle": round(on_time / seconds * 100, 1),
+                "cycles_per_hour": round(cycles / (seconds / 3600), 2),
+            }
+        return result
+
+    def as_dict(self, now: float) -> dict:
+        """Return the counters for persisting."""
+        self._accrue(now)
+        return {
+            "accounted_until": now,
+            "minutes": self._minutes.as_dict(),
+            "hours": self._hours.as_dict(),
+        }
+
+    def restore(self, data: dict) -> None:
+        """Restore counters returned by `as_dict`.
+
+        A running on period is kept, minus any part already booked before
+        the counters were saved.
+        """
+        self._minutes.restore(data.get("minutes") or {})
+        self._hours.restore(data.get("hours") or {})
+        accounted_until = data.get("accounted_until")
+        if self._on_since is not None and accounted_until is not None:
+            self._on_since = max(self._on_since, float(accounted_until))
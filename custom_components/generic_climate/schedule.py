@@ -0,0 +1,126 @@
+"""Weekly setpoint schedules for Generic Climate zones."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from datetime import datetime, time, timedelta
+
+WEEK = 7 * 86400
+DAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+
+def _parse_days(spec: str) -> list[int]:
+    """Parse `mon`, `mon-fri`, `sat,sun` or `daily` into weekday numbers."""
+    days: list[int] = []
+    for part in spec.lower().replace(" ", "").split(","):
+        if part == "daily":
+            days.extend(range(7))
+            continue
+        first, _, last = part.partition("-")
+        if first not in DAYS or (last and last not in DAYS):
+            raise ValueError(f"invalid day: {part}")
+        start = DAYS.index(first)
+        end = DAYS.index(last) if last else start
+        days.extend(day % 7 for day in range(start, end + 1 if end >= start else end + 8))
+    return days
+
+
+def _parse_time(spec: str) -> int:
+    """Parse `HH:MM` or `HH:MM:SS` into seconds since midnight."""
+    parts = spec.split(":")
+    try:
+        hour, minute, second = (int(part) for part in (*parts, "0")[:3])
+    except ValueError as err:
+        raise ValueError(f"invalid time: {spec}") from err
+    if len(parts) not in (2, 3) or not (
+        0 <= hour < 24 and 0 <= minute < 60 and 0 <= second < 60
+    ):
+        raise ValueError(f"invalid time: {spec}")
+    return hour * 3600 + minute * 60 + second
+
+
+class WeeklySchedule:
+    """A weekly program of setpoints compiled into a sorted transition index.
+
+    The program maps day specs to `{"HH:MM": temperature}`. Transitions are
+    stored as seconds since Monday 00:00 in one sorted array, so the active
+    setpoint and the next transition are found by bisection. With a preheat
+    offset, transitions that raise the setpoint start that much earlier,
+    without moving past the transition before them.
+    """
+
+    def __init__(
+        self, program: dict[str, dict[str, float]], preheat: timedelta | None = None
+    ) -> None:
+        transitions: dict[int, float] = {}
+        for day_spec, setpoints in program.items():
+            for day in _parse_days(str(day_spec)):
+                for time_spec, temperature in setpoints.items():
+                    transitions[day * 86400 + _parse_time(str(time_spec))] = float(
+                        temperature
+                    )
+        if not transitions:
+            raise ValueError("schedule has no transitions")
+        ordered = sorted(transitions.items())
+
+        if preheat:
+            offset = preheat.total_seconds()
+            shifted = []
+            for index, (second, temperature) in enumerate(ordered):
+                previous_second, previous_temperature = ordered[index - 1]
+                if temperature > previous_temperature:
+                    gap = (second - previous_second) % WEEK or WEEK
+                    second = (second - min(offset, gap - 1)) % WEEK
+                shifted.append((second, temperature))
+            ordered = sorted(shifted)
+
+        self._seconds = array("d", (second for second, _ in ordered))
+        self._temperatures = array("d", (temperature for _, temperature in ordered))
+
+    def __len__(self) -> int:
+        """Return the number of transitions per week."""
+        return len(self._seconds)
+
+    @staticmethod
+    def _second_of_week(now: datetime) -> float:
+        return (
+            now.weekday() * 86400
+            + now.hour * 3600
+            + now.minute * 60
+            + now.second
+            + now.microsecond / 1e6
+        )
+
+    def setpoint(self, now: datetime) -> float:
+        """Return the setpoint in effect at local time now."""
+        index = bisect_right(self._seconds, self._second_of_week(now)) - 1
+        # Before the week's first transition the last one still holds.
+        return self._temperatures[index]
+
+    def next_transition(self, now: datetime) -> tuple[datetime, float]:
+        """Return the local time and setpoint of the next transition after now."""
+        index = bisect_right(self._seconds, self._second_of_week(now))
+        week_start = now.date() - timedelta(days=now.weekday())
+        if index == len(self._seconds):
+            index = 0
+            week_start += timedelta(days=7)
+        second = int(self._seconds[index])
+        # Build the wall-clock time so DST changes within the week hold.
+        when = datetime.combine(
+            week_start + timedelta(days=second // 86400),
+            time(second % 86400 // 3600, second % 3600 // 60, second % 60),
+            tzinfo=now.tzinfo,
+        )
+        return when, self._temperatures[index]
+
+    def as_dict(self) -> list[dict]:
+        """Return the compiled transitions for diagnostics."""
+        return [
+            {
+                "day": DAYS[int(second) // 86400],
+                "time": str(timedelta(seconds=int(second) % 86400)),
+                "temperature": temperature,
+            }
+            for second, temperature in zip(self._seconds, self._temperatures)
+        ]
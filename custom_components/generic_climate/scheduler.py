@@ -0,0 +1,152 @@
+"""Shared deadline scheduler for Generic Climate zones."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from datetime import timedelta
+import heapq
+from itertools import count
+import logging
+import zlib
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DeadlineScheduler:
+    """Run the deadlines of every zone from one heap and a single loop timer.
+
+    Deadlines are keyed; re-arming a key earlier pushes a new heap entry and
+    leaves the old one behind to be skipped when it surfaces, so arming,
+    re-arming and cancelling are all O(log n) or better. Pushing a deadline
+    back, as a watchdog does on every reading, only updates the key's entry:
+    its heap entry moves when it surfaces, so this costs O(1) and does not
+    grow the heap.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._entries: dict[Hashable, tuple[int, float, HassJob, float | None]] = {}
+        self._seq = count()
+        self._handle = None
+        self._handle_when: float | None = None
+
+    def __len__(self) -> int:
+        """Return the number of armed deadlines."""
+        return len(self._entries)
+
+    @callback
+    def async_schedule(
+        self,
+        key: Hashable,
+        delay: float,
+        action: Callable,
+        period: float | None = None,
+    ) -> None:
+        """Arm or re-arm the deadline for key, `delay` seconds from now.
+
+        With a period the action keeps firing every `period` seconds until
+        the key is cancelled. The action is called with the current UTC time.
+        """
+        self._push(key, self.hass.loop.time() + delay, HassJob(action), period)
+
+    @callback
+    def async_track_interval(
+        self, key: Hashable, seed: str, interval: timedelta, action: Callable
+    ) -> CALLBACK_TYPE:
+        """Fire action every interval at a deterministic offset derived from seed.
+
+        Offsets are spread evenly over the interval, so zones that start
+        together do not all fire together.
+        """
+        period = interval.total_seconds()
+        offset = zlib.crc32(seed.encode()) / 0x100000000 * period
+        now = self.hass.loop.time()
+        self._push(key, now + (offset - now) % period, HassJob(action), period)
+
+        @callback
+        def _async_cancel() -> None:
+            self.async_cancel(key)
+
+        return _async_cancel
+
+    @callback
+    def async_cancel(self, key: Hashable) -> None:
+        """Disarm the deadline for key, if any."""
+        self._entries.pop(key, None)
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._compact()
+
+    def _push(
+        self, key: Hashable, when: float, job: HassJob, period: float | None
+    ) -> None:
+        if (entry := self._entries.get(key)) is not None and when >= entry[1]:
+            self._entries[key] = (entry[0], when, job, period)
+            return
+        seq = next(self._seq)
+        self._entries[key] = (seq, when, job, period)
+        heapq.heappush(self._heap, (when, seq, key))
+        if self._handle_when is None or when < self._handle_when:
+            self._arm(when)
+
+    def _compact(self) -> None:
+        """Drop heap entries that were superseded or cancelled."""
+        self._heap[:] = [
+            (when, seq, key) for key, (seq, when, _, _) in self._entries.items()
+        ]
+        heapq.heapify(self._heap)
+
+    def _arm(self, when: float) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = self.hass.loop.call_at(when, self._async_fire)
+        self._handle_when = when
+
+    @callback
+    def _async_fire(self) -> None:
+        """Run every deadline that is due and arm the timer for the next one."""
+        self._handle = None
+        self._handle_when = None
+        heap = self._heap
+        entries = self._entries
+        now = self.hass.loop.time()
+        utc_now = dt_util.utcnow()
+
+        try:
+            while heap and heap[0][0] <= now:
+                _, seq, key = heapq.heappop(heap)
+                entry = entries.get(key)
+                if entry is None or entry[0] != seq:
+                    continue
+                _, when, job, period = entry
+                if when > now:
+                    # Pushed back since this heap entry was made.
+                    heapq.heappush(heap, (when, seq, key))
+                    continue
+                if period is None:
+                    del entries[key]
+                else:
+                    # Keep the phase, skipping beats missed while the loop
+                    # was busy.
+                    next_when = when + period
+                    if next_when <= now:
+                        next_when += ((now - next_when) // period + 1) * period
+                    next_seq = next(self._seq)
+                    entries[key] = (next_seq, next_when, job, period)
+                    heapq.heappush(heap, (next_when, next_seq, key))
+                try:
+                    self.hass.async_run_hass_job(job, utc_now)
+                except Exception:  # pylint: disable=broad-except
+                    # One failing action must not hold up the other zones.
+                    _LOGGER.exception("Error running scheduled action for %s", key)
+        finally:
+            while heap:
+                _, seq, key = heap[0]
+                entry = entries.get(key)
+                if entry is not None and entry[0] == seq:
+                    self._arm(heap[0][0])
+                    break
+                heapq.heappop(heap)
@@ -0,0 +1,265 @@
+"""Diagnostic, runtime statistic and heat demand sensors for Generic Climate."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import partial
+
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_NAME, PERCENTAGE, EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from . import async_get_coordinator
+from .const import (
+    CONF_COOLER,
+    CONF_HEATER,
+    CONF_INSTRUMENTATION,
+    CONF_PLANT_SWITCH,
+    DEFAULT_NAME,
+    DOMAIN,
+)
+from .demand import PlantDemand
+from .instrumentation import ZoneMetrics
+from .runtime_stats import WINDOW_1H, WINDOW_7D, WINDOW_24H, RuntimeStats
+from .thermal_model import ACTUATOR_COOL, ACTUATOR_HEAT
+
+# Metrics are read on a timer so the control path never pays for updates.
+SCAN_INTERVAL = timedelta(seconds=60)
+
+
+@dataclass(frozen=True, kw_only=True)
+class GenericClimateSensorEntityDescription(SensorEntityDescription):
+    """Describes a Generic Climate diagnostic sensor."""
+
+    value_fn: Callable[[ZoneMetrics], float | int | None]
+
+
+@dataclass(frozen=True, kw_only=True)
+class GenericClimateRuntimeSensorEntityDescription(SensorEntityDescription):
+    """Describes a runtime statistic of one actuator over a rolling window."""
+
+    window: int
+    value_fn: Callable[[float, int, int], float]
+
+
+def _duty_cycle(label, window):
+    return GenericClimateRuntimeSensorEntityDescription(
+        key=f"duty_cycle_{label}",
+        name=f"Duty cycle {label}",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        entity_registry_enabled_default=False,
+        window=window,
+        value_fn=lambda on_time, cycles, window: on_time / window * 100,
+    )
+
+
+# Polled, so with many zones they are opt-in rather than recorder traffic
+# every zone pays for.
+RUNTIME_SENSORS: tuple[GenericClimateRuntimeSensorEntityDescription, ...] = (
+    _duty_cycle("1h", WINDOW_1H),
+    _duty_cycle("24h", WINDOW_24H),
+    _duty_cycle("7d", WINDOW_7D),
+    GenericClimateRuntimeSensorEntityDescription(
+        key="on_time_24h",
+        name="On time 24h",
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        entity_registry_enabled_default=False,
+        window=WINDOW_24H,
+        value_fn=lambda on_time, cycles, window: on_time / 3600,
+    ),
+    GenericClimateRuntimeSensorEntityDescription(
+        key="cycles_per_hour_24h",
+        name="Cycles per hour 24h",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        entity_registry_enabled_default=False,
+        window=WINDOW_24H,
+        value_fn=lambda on_time, cycles, window: cycles / (window / 3600),
+    ),
+)
+
+
+SENSORS: tuple[GenericClimateSensorEntityDescription, ...] = (
+    GenericClimateSensorEntityDescription(
+        key="control_latency",
+        name="Control latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.event_to_decision.mean,
+    ),
+    GenericClimateSensorEntityDescription(
+        key="lock_wait",
+        name="Lock wait",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.lock_wait.mean,
+    ),
+    GenericClimateSensorEntityDescription(
+        key="service_call",
+        name="Service call duration",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.service_call.mean,
+    ),
+    GenericClimateSensorEntityDescription(
+        key="decisions",
+        name="Decisions",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: sum(metrics.outcomes.values()),
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the diagnostic sensors from a config entry."""
+    data = {**config_entry.data, **config_entry.options}
+    coordinator = async_get_coordinator(hass)
+    name = data.get(CONF_NAME, DEFAULT_NAME)
+
+    entities: list[SensorEntity] = [
+        GenericClimateRuntimeSensor(
+            coordinator, config_entry, name, actuator, description
+        )
+        for actuator, conf in ((ACTUATOR_HEAT, CONF_HEATER), (ACTUATOR_COOL, CONF_COOLER))
+        if data.get(conf)
+        for description in RUNTIME_SENSORS
+    ]
+    if data.get(CONF_INSTRUMENTATION):
+        entities.extend(
+            GenericClimateDiagnosticSensor(coordinator, config_entry, name, description)
+            for description in SENSORS
+        )
+    # A plant's demand sensor comes with the first of its zones set up.
+    plant = coordinator.async_get_plant(data.get(CONF_PLANT_SWITCH))
+    plant.sensor_platforms[config_entry.entry_id] = async_add_entities
+    config_entry.async_on_unload(
+        partial(plant.sensor_platforms.pop, config_entry.entry_id, None)
+    )
+    if plant.sensor_entry_id is None:
+        entities.append(GenericClimateDemandSensor(plant, config_entry.entry_id))
+    async_add_entities(entities)
+
+
+class GenericClimateDiagnosticSensor(SensorEntity):
+    """Expose one control path metric of a zone."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = True
+
+    entity_description: GenericClimateSensorEntityDescription
+
+    def __init__(self, coordinator, config_entry, name, description):
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._coordinator = coordinator
+        self._entry_id = config_entry.entry_id
+        self._attr_name = f"{name} {description.name}"
+        self._attr_unique_id = f"{config_entry.entry_id}_{description.key}"
+
+    @property
+    def native_value(self):
+        """Return the current value of the metric."""
+        entity = self._coordinator.entities.get(self._entry_id)
+        if entity is None or entity.metrics is None:
+            return None
+        return self.entity_description.value_fn(entity.metrics)
+
+
+class GenericClimateRuntimeSensor(SensorEntity):
+    """Expose one rolling runtime statistic of a zone's heater or cooler."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = True
+
+    entity_description: GenericClimateRuntimeSensorEntityDescription
+
+    def __init__(self, coordinator, config_entry, name, actuator, description):
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._coordinator = coordinator
+        self._entry_id = config_entry.entry_id
+        self._actuator = actuator
+        label = "Heater" if actuator == ACTUATOR_HEAT else "Cooler"
+        self._attr_name = f"{name} {label} {description.name.lower()}"
+        self._attr_unique_id = f"{config_entry.entry_id}_{actuator}_{description.key}"
+
+    @property
+    def native_value(self):
+        """Return the current value of the statistic."""
+        entity = self._coordinator.entities.get(self._entry_id)
+        if entity is None:
+            return None
+        stats: RuntimeStats = entity.runtime_stats[self._actuator]
+        window = self.entity_description.window
+        on_time, cycles = stats.window(dt_util.utcnow().timestamp(), window)
+        return self.entity_description.value_fn(on_time, cycles, window)
+
+
+class GenericClimateDemandSensor(SensorEntity):
+    """Expose the aggregate heat demand of the zones sharing a plant."""
+
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_should_poll = False
+    _attr_icon = "mdi:fire"
+
+    def __init__(self, plant: PlantDemand, entry_id: str) -> None:
+        """Initialize the sensor."""
+        self._plant = plant
+        self._entry_id = entry_id
+        plant.sensor_entry_id = entry_id
+        switch_entity_id = plant.switch_entity_id
+        if switch_entity_id is None:
+            self._attr_name = f"{DEFAULT_NAME} heat demand"
+            self._attr_unique_id = f"{DOMAIN}_heat_demand"
+        else:
+            self._attr_name = f"{switch_entity_id.split('.', 1)[1]} heat demand"
+            self._attr_unique_id = f"{DOMAIN}_heat_demand_{switch_entity_id}"
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the plant's demand."""
+        self.async_on_remove(self._plant.async_add_listener(self._async_demand_changed))
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Hand the plant over to another of its zones, if one is left."""
+        self._plant.sensor_entry_id = None
+        for entry_id, async_add_entities in self._plant.sensor_platforms.items():
+            if entry_id != self._entry_id:
+                async_add_entities([GenericClimateDemandSensor(self._plant, entry_id)])
+                return
+
+    @callback
+    def _async_demand_changed(self) -> None:
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self):
+        """Return the weight of calling zones as a percentage of all zones."""
+        return self._plant.demand
+
+    @property
+    def extra_state_attributes(self):
+        """Return the calling zone count and the weighted demand."""
+        return {
+            "calling_zones": self._plant.calling,
+            "zones": self._plant.zones,
+            "weighted_demand": self._plant.weighted,
+            "plant_switch": self._plant.switch_entity_id,
+        }
@@ -0,0 +1,107 @@
+"""Streaming temperature slope estimate for Generic Climate zones."""
+
+from __future__ import annotations
+
+from array import array
+
+
+class StreamingSlope:
+    """Least-squares slope over the last `size` readings, updated in O(1).
+
+    Running sums of the window are kept: a reading adds its terms and
+    subtracts those of the reading it pushes out of the ring. Times are
+    taken relative to an origin, and the sums are rebuilt from the ring each
+    time it wraps, so they neither lose precision nor drift; that costs O(1)
+    amortized per reading.
+    """
+
+    __slots__ = (
+        "_times",
+        "_values",
+        "_size",
+        "_next",
+        "count",
+        "_origin",
+        "_sum_t",
+        "_sum_v",
+        "_sum_tt",
+        "_sum_tv",
+    )
+
+    def __init__(self, size: int) -> None:
+        self._times = array("d", [0.0] * size)
+        self._values = array("d", [0.0] * size)
+        self._size = size
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every reading."""
+        self._next = 0
+        self.count = 0
+        self._origin: float | None = None
+        self._sum_t = self._sum_v = self._sum_tt = self._sum_tv = 0.0
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a reading, dropping the oldest one once the window is full."""
+        if self._origin is None:
+            self._origin = timestamp
+        time = timestamp - self._origin
+        index = self._next
+        if self.count == self._size:
+            old_time, old_value = self._times[index], self._values[index]
+            self._sum_t -= old_time
+            self._sum_v -= old_value
+            self._sum_tt -= old_time * old_time
+            self._sum_tv -= old_time * old_value
+        else:
+            self.count += 1
+        self._times[index] = time
+        self._values[index] = value
+        self._sum_t += time
+        self._sum_v += value
+        self._sum_tt += time * time
+        self._sum_tv += time * value
+        self._next = (index + 1) % self._size
+        if self._next == 0:
+            self._rebase()
+
+    def _rebase(self) -> None:
+        """Move the origin to the oldest reading and recompute the sums."""
+        used = self.count
+        start = (self._next - used) % self._size
+        shift = self._times[start]
+        self._origin += shift
+        self._sum_t = self._sum_v = self._sum_tt = self._sum_tv = 0.0
+        for offset in range(used):
+            index = (start + offset) % self._size
+            time = self._times[index] = self._times[index] - shift
+            value = self._values[index]
+            self._sum_t += time
+            self._sum_v += value
+            self._sum_tt += time * time
+            self._sum_tv += time * value
+
+    @property
+    def span(self) -> float:
+        """Return the seconds between the oldest and the newest reading."""
+        if self.count < 2:
+            return 0.0
+        newest = self._times[(self._next - 1) % self._size]
+        oldest = self._times[(self._next - self.count) % self._size]
+        return newest - oldest
+
+    @property
+    def newest(self) -> float | None:
+        """Return the timestamp of the newest reading, or None without any."""
+        if not self.count:
+            return None
+        return self._origin + self._times[(self._next - 1) % self._size]
+
+    @property
+    def slope(self) -> float | None:
+        """Return the change per second, or None with too few readings."""
+        count = self.count
+        denominator = count * self._sum_tt - self._sum_t * self._sum_t
+        if count < 2 or denominator <= 0:
+            return None
+        return (count * self._sum_tv - self._sum_t * self._sum_v) / denominator
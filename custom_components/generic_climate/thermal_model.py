@@ -0,0 +1,67 @@
+"""Streaming thermal model of a Generic Climate zone."""
+
+from __future__ import annotations
+
+import math
+
+ACTUATOR_OFF = "off"
+ACTUATOR_HEAT = "heat"
+ACTUATOR_COOL = "cool"
+
+# Samples further apart than this say little about the current rate.
+MAX_SAMPLE_GAP = 3600.0
+MIN_SAMPLES = 3
+
+
+class ThermalModel:
+    """Learn how fast a zone warms or cools in each actuator state.
+
+    Every sample updates an exponentially weighted estimate of the
+    temperature rate (degrees per second) for the actuator state it was taken
+    in. Memory is constant: only the previous sample and one rate per state
+    are kept.
+    """
+
+    def __init__(self, time_constant: float = 3600.0) -> None:
+        self.time_constant = time_constant
+        self.rates: dict[str, float] = {}
+        self.samples: dict[str, int] = {}
+        self._last: tuple[float, float, str] | None = None
+
+    def add_sample(self, timestamp: float, temperature: float, actuator: str) -> None:
+        """Feed one temperature reading taken while `actuator` was running."""
+        last = self._last
+        self._last = (timestamp, temperature, actuator)
+        if last is None:
+            return
+        last_timestamp, last_temperature, last_actuator = last
+        elapsed = timestamp - last_timestamp
+        # Readings spanning an actuator transition mix two regimes.
+        if last_actuator != actuator or not 0 < elapsed <= MAX_SAMPLE_GAP:
+            return
+        slope = (temperature - last_temperature) / elapsed
+        if (rate := self.rates.get(actuator)) is None:
+            self.rates[actuator] = slope
+        else:
+            weight = 1 - math.exp(-elapsed / self.time_constant)
+            self.rates[actuator] = rate + weight * (slope - rate)
+        self.samples[actuator] = self.samples.get(actuator, 0) + 1
+
+    def predict_delta(self, actuator: str, horizon: float) -> float:
+        """Return the expected temperature change over `horizon` seconds."""
+        if self.samples.get(actuator, 0) < MIN_SAMPLES:
+            return 0.0
+        return self.rates[actuator] * horizon
+
+    def as_dict(self) -> dict:
+        """Return the learned parameters for persisting."""
+        return {"rates": dict(self.rates), "samples": dict(self.samples)}
+
+    def restore(self, data: dict) -> None:
+        """Restore parameters returned by `as_dict`."""
+        self.rates = {
+            key: float(value) for key, value in (data.get("rates") or {}).items()
+        }
+        self.samples = {
+            key: int(value) for key, value in (data.get("samples") or {}).items()
+        }
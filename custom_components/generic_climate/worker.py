@@ -0,0 +1,77 @@
+"""Latest-intent control worker for Generic Climate zones."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant
+
+
+def _consume(future: asyncio.Future) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+class LatestIntentWorker:
+    """Run a zone's control pass with a single-slot mailbox.
+
+    At most one pass is in flight. Requests arriving meanwhile are merged
+    into the one pending slot, so however slow an actuator is, at most one
+    pass waits behind it and that pass reads the freshest state when it
+    starts.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        run: Callable[[datetime | None, bool], Awaitable[None]],
+    ) -> None:
+        self.hass = hass
+        self._run = run
+        self._pending: tuple[datetime | None, bool, asyncio.Future] | None = None
+        self._task: asyncio.Task | None = None
+        self.merged = 0
+
+    async def async_request(self, time: datetime | None = None, force: bool = False) -> None:
+        """Request a control pass and wait until one covering it has run."""
+        if self._pending is None:
+            future = self.hass.loop.create_future()
+        else:
+            # Merge with the waiting request: a forced or keep-alive pass
+            # stays forced or keep-alive.
+            pending_time, pending_force, future = self._pending
+            time = time or pending_time
+            force = force or pending_force
+            self.merged += 1
+        self._pending = (time, force, future)
+        if self._task is None:
+            self._task = self.hass.async_create_task(self._async_work())
+        # Several callers may share the future; one giving up must not
+        # cancel it for the others.
+        await asyncio.shield(future)
+
+    async def _async_work(self) -> None:
+        try:
+            while self._pending is not None:
+                time, force, future = self._pending
+                self._pending = None
+                try:
+                    await self._run(time, force)
+                except asyncio.CancelledError:
+                    # Not an Exception; without this the waiters never wake.
+                    future.cancel()
+                    if self._pending is not None:
+                        self._pending[2].cancel()
+                        self._pending = None
+                    raise
+                except Exception as err:  # pylint: disable=broad-except
+                    future.set_exception(err)
+                else:
+                    future.set_result(None)
+                finally:
+                    # Retrieve the outcome even if every waiter went away.
+                    future.add_done_callback(_consume)
+        finally:
+            self._task = None